@@ -3,7 +3,65 @@
 Character class for the ASCII RPG game.
 """
 
+def _compute_modifier(score):
+    """Calculate ability score modifier from the standard thresholds."""
+    if score <= 3: return -3
+    if score <= 5: return -2
+    if score <= 8: return -1
+    if score <= 12: return 0
+    if score <= 15: return 1
+    if score <= 17: return 2
+    return 3
+
+# Precomputed modifiers indexed by ability score
+_MOD_TABLE = tuple(_compute_modifier(score) for score in range(26))
+
+# Equipment slots in display order
+EQUIPMENT_SLOTS = (
+    'helmet', 'cuirass', 'greaves', 'boots',
+    'left_glove', 'right_glove',
+    'weapon', 'shield'
+)
+
+class Equipped:
+    """Equipment slots stored as fixed attributes, with dict-style access for UI and saves."""
+    __slots__ = EQUIPMENT_SLOTS
+
+    def __init__(self):
+        self.helmet = None
+        self.cuirass = None
+        self.greaves = None
+        self.boots = None
+        self.left_glove = None
+        self.right_glove = None
+        self.weapon = None
+        self.shield = None
+
+    def __getitem__(self, slot):
+        return getattr(self, slot)
+
+    def __setitem__(self, slot, item):
+        setattr(self, slot, item)
+
+    def __len__(self):
+        return len(EQUIPMENT_SLOTS)
+
+    def __iter__(self):
+        return iter(EQUIPMENT_SLOTS)
+
+    def keys(self):
+        """Get the slot names in display order."""
+        return EQUIPMENT_SLOTS
+
+    def items(self):
+        """Get (slot, item) pairs in display order."""
+        return [(slot, getattr(self, slot)) for slot in EQUIPMENT_SLOTS]
+
 class Character:
+    __slots__ = ('name', 'char_class', 'level', 'xp', 'hp', 'max_hp', '_ability_scores',
+                 'str_mod', 'dex_mod', 'thac0', 'saving_throws', 'inventory', 'equipped',
+                 '_cached_ac', '_ac_dirty')
+    
     def __init__(self):
         self.name = "Hero"
         self.char_class = "Fighter"
@@ -21,18 +79,45 @@ class Character:
             'breath': 15, 'spells': 16
         }
         self.inventory = []
-        self.equipped = {
-            'helmet': None, 'cuirass': None, 'greaves': None, 'boots': None,
-            'left_glove': None, 'right_glove': None,
-            'weapon': None, 'shield': None
-        }
+        self.equipped = Equipped()
+        
+        # Derived armor class, recomputed by combat only after equipment changes
+        self._cached_ac = 10
+        self._ac_dirty = True
+
+    @property
+    def ability_scores(self):
+        """Ability scores by name.
+        
+        str_mod and dex_mod are cached from these, so change scores by assigning
+        a new dict or through set_ability(); editing the returned dict in place
+        leaves the modifiers and armor class stale.
+        """
+        return self._ability_scores
+
+    @ability_scores.setter
+    def ability_scores(self, scores):
+        self._ability_scores = scores
+        self.refresh_modifiers()
+
+    def set_ability(self, name, value):
+        """Set a single ability score and refresh the cached modifiers."""
+        self._ability_scores[name] = value
+        self.refresh_modifiers()
+
+    def refresh_modifiers(self):
+        """Recompute the cached combat modifiers after the ability scores change."""
+        scores = self._ability_scores
+        self.str_mod = self.get_modifier(scores['str'])
+        self.dex_mod = self.get_modifier(scores['dex'])
+        self._ac_dirty = True
+
+    def invalidate_ac(self):
+        """Mark the cached armor class as stale after equipment or ability changes."""
+        self._ac_dirty = True
 
     def get_modifier(self, score):
         """Calculate ability score modifier."""
-        if score <= 3: return -3
-        if score <= 5: return -2
-        if score <= 8: return -1
-        if score <= 12: return 0
-        if score <= 15: return 1
-        if score <= 17: return 2
-        return 3
\ No newline at end of file
+        if 0 <= score < 26:
+            return _MOD_TABLE[score]
+        return 3 if score > 25 else -3
\ No newline at end of file
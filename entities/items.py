@@ -6,7 +6,21 @@ import random
 from ui.colors import C_TEXT_DIM, C_TEXT, C_BROWN
 from ui.ascii_definitions import ASCII_DEFS
 
+# Resolved (char, color) pairs keyed by item ID
+_ITEM_VISUALS = {}
+
+def _get_item_visuals(item_id):
+    """Get the (char, color) pair for an item, resolving it only once."""
+    visuals = _ITEM_VISUALS.get(item_id)
+    if visuals is None:
+        item_def = ASCII_DEFS.get_item(item_id)
+        visuals = _ITEM_VISUALS[item_id] = (item_def['char'], item_def['color'])
+    return visuals
+
 class Item:
+    __slots__ = ('name', 'item_id', 'slot', 'item_type', 'hands', 'damage', 'defense',
+                 'char', 'color')
+    
     def __init__(self, name, item_id, slot, item_type, hands=1, damage='1d6', defense=0):
         self.name = name
         self.item_id = item_id
@@ -17,23 +31,28 @@ class Item:
         self.defense = defense
         
         # Get character and color from ASCII definitions
-        item_def = ASCII_DEFS.get_item(item_id)
-        self.char = item_def['char']
-        self.color = item_def['color']
+        self.char, self.color = _get_item_visuals(item_id)
+
+# Random loot table: (name, item_id, slot, item_type, hands, damage, defense)
+_ITEMS_DATA = (
+    ("Rusty Sword", 'sword', 'weapon', 'weapon', 1, '1d8', 0),
+    ("Iron Axe", 'axe', 'weapon', 'weapon', 1, '1d8', 0),
+    ("Greatsword", 'greatsword', 'weapon', 'weapon', 2, '1d10', 0),
+    ("Leather Helm", 'helmet', 'helmet', 'armor', 1, '1d6', 1),
+    ("Steel Cuirass", 'armor_piece', 'cuirass', 'armor', 1, '1d6', 3),
+    ("Chain Glove", 'armor_piece', 'left_glove', 'armor', 1, '1d6', 1),
+    ("Plated Greaves", 'armor_piece', 'greaves', 'armor', 1, '1d6', 2),
+    ("Worn Boots", 'armor_piece', 'boots', 'armor', 1, '1d6', 1),
+    ("Wooden Shield", 'shield', 'shield', 'armor', 1, '1d6', 2)
+)
+
+# Shared Item instances keyed by their loot table entry; items are never mutated
+_ITEM_CACHE = {}
 
 def create_random_item():
     """Creates a random item using ASCII definitions."""
-    items_data = [
-        ("Rusty Sword", 'sword', 'weapon', 'weapon', 1, '1d8', 0),
-        ("Iron Axe", 'axe', 'weapon', 'weapon', 1, '1d8', 0),
-        ("Greatsword", 'greatsword', 'weapon', 'weapon', 2, '1d10', 0),
-        ("Leather Helm", 'helmet', 'helmet', 'armor', 1, '1d6', 1),
-        ("Steel Cuirass", 'armor_piece', 'cuirass', 'armor', 1, '1d6', 3),
-        ("Chain Glove", 'armor_piece', 'left_glove', 'armor', 1, '1d6', 1),
-        ("Plated Greaves", 'armor_piece', 'greaves', 'armor', 1, '1d6', 2),
-        ("Worn Boots", 'armor_piece', 'boots', 'armor', 1, '1d6', 1),
-        ("Wooden Shield", 'shield', 'shield', 'armor', 1, '1d6', 2)
-    ]
-    
-    name, item_id, slot, item_type, hands, damage, defense = random.choice(items_data)
-    return Item(name, item_id, slot, item_type, hands, damage, defense)
\ No newline at end of file
+    item_data = random.choice(_ITEMS_DATA)
+    item = _ITEM_CACHE.get(item_data)
+    if item is None:
+        item = _ITEM_CACHE[item_data] = Item(*item_data)
+    return item
\ No newline at end of file
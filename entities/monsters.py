@@ -2,28 +2,59 @@
 """
 Monster classes using centralized ASCII definitions.
 """
-import random
+import bisect
+import functools
+import itertools
 from ui.colors import C_TEXT_DIM, C_BROWN
-from ui.ascii_definitions import ASCII_DEFS
+from ui.ascii_definitions import ASCII_DEFS, ColorPulse
+from systems.dice import parse_dice, rng, randint, choices, getrandbits
+
+# Die faces for bulk group-size rolls
+_D10_FACES = tuple(range(1, 11))
+_D4_FACES = tuple(range(1, 5))
+
+# Status color pulses: effect type -> (pulse color, duration in ms)
+_MONSTER_EFFECTS = {
+    'burning': ((255, 100, 0), 1000),
+    'poisoned': ((100, 255, 100), 1500),
+    'frozen': ((150, 200, 255), 2000),
+}
+
+# Resolved (char, color) pairs keyed by entity ID
+_ENTITY_CACHE = {}
+
+def _get_entity_visuals(entity_id):
+    """Get the (char, color) pair for an entity, resolving it only once."""
+    visuals = _ENTITY_CACHE.get(entity_id)
+    if visuals is None:
+        entity_def = ASCII_DEFS.get_entity(entity_id)
+        visuals = _ENTITY_CACHE[entity_id] = (entity_def['char'], entity_def['color'])
+    return visuals
 
 class Monster:
     """Base monster class using ASCII definitions."""
+    __slots__ = ('name', 'entity_id', 'char', 'color', 'ac', 'hd', 'hp', 'max_hp', 'half_hp',
+                 'attacks', 'damage_dice', 'thac0', 'movement', 'saves', 'morale',
+                 'alignment', 'xp_value', 'special_abilities', 'is_alive', 'reaction',
+                 'has_acted_this_round', 'color_effect', 'char_effect', '_render_info')
+    
     def __init__(self, name, entity_id, ac, hd, hp, attacks, thac0, movement, 
                  saves, morale, alignment, xp_value, special_abilities=None):
         self.name = name
         self.entity_id = entity_id
         
         # Get character and color from ASCII definitions
-        entity_def = ASCII_DEFS.get_entity(entity_id)
-        self.char = entity_def['char']
-        self.color = entity_def['color']
+        self.char, self.color = _get_entity_visuals(entity_id)
+        self._render_info = (self.char, self.color)
         
         # Monster stats
         self.ac = ac
         self.hd = hd
         self.hp = hp
         self.max_hp = hp
+        self.half_hp = hp // 2  # Morale threshold; max_hp never changes
         self.attacks = attacks
+        self.damage_dice = [parse_dice(attack.get('damage', '1d4')) for attack in attacks]
         self.thac0 = thac0
         self.movement = movement
         self.saves = saves
@@ -43,38 +74,35 @@ class Monster:
 
     def add_visual_effect(self, effect_type):
         """Add a visual effect to the monster."""
-        if effect_type == 'burning':
-            # Add fire effect
-            from ui.ascii_definitions import ColorPulse
-            self.color_effect = ColorPulse(self.color, (255, 100, 0), duration=1000, repeat=True)
-            self.color_effect.start()
-        elif effect_type == 'poisoned':
-            # Add poison effect
-            from ui.ascii_definitions import ColorPulse
-            self.color_effect = ColorPulse(self.color, (100, 255, 100), duration=1500, repeat=True)
-            self.color_effect.start()
-        elif effect_type == 'frozen':
-            # Add ice effect
-            from ui.ascii_definitions import ColorPulse
-            self.color_effect = ColorPulse(self.color, (150, 200, 255), duration=2000, repeat=True)
+        pulse = _MONSTER_EFFECTS.get(effect_type)
+        if pulse:
+            pulse_color, duration = pulse
+            self.color_effect = ColorPulse(self.color, pulse_color, duration=duration, repeat=True)
             self.color_effect.start()
 
     def get_render_info(self):
-        """Get current rendering information with effects."""
+        """Get the current (char, color) pair for rendering, with effects."""
+        color_effect = self.color_effect
+        char_effect = self.char_effect
+        
+        # Fast path: without effects the base appearance never changes
+        if color_effect is None and char_effect is None:
+            return self._render_info
+        
         char = self.char
         color = self.color
         
         # Apply color effects
-        if self.color_effect and self.color_effect.active:
-            self.color_effect.update()
-            color = self.color_effect.get_current_color()
+        if color_effect and color_effect.active:
+            color_effect.update()
+            color = color_effect.get_current_color()
         
         # Apply character effects
-        if self.char_effect and self.char_effect.active:
-            self.char_effect.update()
-            char = self.char_effect.get_current_char()
+        if char_effect and char_effect.active:
+            char_effect.update()
+            char = char_effect.get_current_char()
         
-        return {'char': char, 'color': color}
+        return char, color
 
     def take_damage(self, damage):
         """Apply damage to the monster."""
@@ -88,12 +116,14 @@ class Monster:
         """Heal the monster."""
         self.hp = min(self.hp + amount, self.max_hp)
 
-    def make_attack_roll(self, target_ac, ability_modifier=0, situational_modifier=0):
+    def make_attack_roll(self, target_ac, ability_modifier=0, situational_modifier=0,
+                         _randint=randint):
         """Make an attack roll against a target AC."""
-        roll = random.randint(1, 20)
+        thac0 = self.thac0
+        roll = _randint(1, 20)
         total_roll = roll + ability_modifier + situational_modifier
         
-        required_roll = self.thac0 - target_ac
+        required_roll = thac0 - target_ac
         hit = total_roll >= required_roll
         
         return {
@@ -105,46 +135,54 @@ class Monster:
             'fumble': roll == 1
         }
 
-    def roll_damage(self, attack_index=0):
+    def roll_damage(self, attack_index=0, _randint=randint):
         """Roll damage for an attack."""
-        if attack_index >= len(self.attacks):
+        if attack_index >= len(self.damage_dice):
             return 0
         
-        attack = self.attacks[attack_index]
-        damage_dice = attack.get('damage', '1d4')
+        num_dice, die_size, modifier = self.damage_dice[attack_index]
+        if not num_dice:
+            return modifier
         
-        if 'd' in damage_dice:
-            if damage_dice.startswith('1d'):
-                die_size = int(damage_dice[2:])
-                return random.randint(1, die_size)
-            else:
-                parts = damage_dice.split('d')
-                num_dice = int(parts[0])
-                die_size = int(parts[1])
-                return sum(random.randint(1, die_size) for _ in range(num_dice))
-        else:
-            return int(damage_dice)
+        damage = sum(_randint(1, die_size) for _ in range(num_dice)) + modifier
+        return max(1, damage)
 
-    def make_morale_check(self, modifier=0):
+    def make_morale_check(self, modifier=0, _randint=randint):
         """Make a morale check. Returns True if passes (continues fighting)."""
-        roll = random.randint(2, 12)
+        roll = _randint(2, 12)
         return roll + modifier <= self.morale
 
+    def clone(self):
+        """Create a fresh copy that shares this monster's static stat data."""
+        cls = self.__class__
+        monster = cls.__new__(cls)
+        for klass in cls.__mro__:
+            for attr in klass.__dict__.get('__slots__', ()):
+                setattr(monster, attr, getattr(self, attr))
+        return monster
+
+# Kobold stat blocks are never mutated, so every instance shares them
+_KOBOLD_ATTACKS = ({'name': 'weapon', 'damage': '1d4-1', 'type': 'melee'},)
+_KOBOLD_SAVES = {'death': 14, 'wands': 15, 'paralysis': 16, 'breath': 17, 'spells': 18}
+_KOBOLD_SPECIALS = ('ambush', 'infravision_90', 'hate_gnomes')
+
 class Kobold(Monster):
     """Kobold monster implementation."""
+    __slots__ = ('is_chieftain', 'is_bodyguard')
+    
     def __init__(self, is_chieftain=False, is_bodyguard=False):
         if is_chieftain:
             name = "Kobold Chieftain"
             entity_id = 'kobold_chieftain'
             hd = 2
-            hp = random.randint(1, 8) + random.randint(1, 8)
+            hp = getrandbits(3) + getrandbits(3) + 2  # 2d8
             morale = 8
             xp_value = 20
         elif is_bodyguard:
             name = "Kobold Bodyguard"
             entity_id = 'kobold'  # Use regular kobold appearance
             hd = 1.5
-            hp = random.randint(1, 8) + 1
+            hp = getrandbits(3) + 2  # 1d8+1
             morale = 8
             xp_value = 15
         else:
@@ -155,92 +193,101 @@ class Kobold(Monster):
             morale = 6
             xp_value = 5
 
-        attacks = [{'name': 'weapon', 'damage': '1d4-1', 'type': 'melee'}]
-        saves = {'death': 14, 'wands': 15, 'paralysis': 16, 'breath': 17, 'spells': 18}
-        special_abilities = ['ambush', 'infravision_90', 'hate_gnomes']
-
         super().__init__(
             name=name,
             entity_id=entity_id,
             ac=7,
             hd=hd,
             hp=hp,
-            attacks=attacks,
+            attacks=_KOBOLD_ATTACKS,
             thac0=19,
             movement=60,
-            saves=saves,
+            saves=_KOBOLD_SAVES,
             morale=morale,
             alignment='Chaotic',
             xp_value=xp_value,
-            special_abilities=special_abilities
+            special_abilities=_KOBOLD_SPECIALS
         )
 
         self.is_chieftain = is_chieftain
         self.is_bodyguard = is_bodyguard
 
-    def roll_damage(self, attack_index=0):
-        """Override damage rolling for kobold weapon attacks."""
-        base_damage = random.randint(1, 4)
-        return max(1, base_damage - 1)
-
 def create_kobold_group(location='wilderness'):
     """Create a group of kobolds based on location."""
     kobolds = []
     
     if location == 'wilderness' or location == 'lair':
         # 6d10 kobolds in wilderness/lair
-        num_kobolds = sum(random.randint(1, 10) for _ in range(6))
+        num_kobolds = sum(choices(_D10_FACES, k=6))
         
         # Add chieftain and bodyguards for large groups
         if num_kobolds >= 10:
             kobolds.append(Kobold(is_chieftain=True))
-            num_bodyguards = random.randint(1, 6)
+            num_bodyguards = randint(1, 6)
             for _ in range(num_bodyguards):
                 kobolds.append(Kobold(is_bodyguard=True))
             num_kobolds -= (1 + num_bodyguards)  # Subtract leader types
     else:
         # 4d4 kobolds in dungeons
-        num_kobolds = sum(random.randint(1, 4) for _ in range(4))
+        num_kobolds = sum(choices(_D4_FACES, k=4))
     
-    # Add regular kobolds
-    for _ in range(num_kobolds):
-        kobolds.append(Kobold())
+    # Add regular kobolds; they are identical, so clone a single prototype
+    if num_kobolds > 0:
+        prototype = Kobold()
+        kobolds.append(prototype)
+        kobolds.extend(prototype.clone() for _ in range(num_kobolds - 1))
     
     return kobolds
 
+# Monster constructors keyed by lowercase name
+_MONSTER_FACTORIES = {
+    'kobold': Kobold,
+    'kobold_chieftain': functools.partial(Kobold, is_chieftain=True),
+    'kobold_bodyguard': functools.partial(Kobold, is_bodyguard=True),
+}
+
 def get_monster_by_name(name):
     """Factory function to create monsters by name."""
-    if name.lower() == 'kobold':
-        return Kobold()
-    elif name.lower() == 'kobold_chieftain':
-        return Kobold(is_chieftain=True)
-    elif name.lower() == 'kobold_bodyguard':
-        return Kobold(is_bodyguard=True)
-    else:
-        # Default to kobold if unknown
-        return Kobold()
+    # Default to kobold if unknown
+    return _MONSTER_FACTORIES.get(name.lower(), Kobold)()
+
+# Shared wilderness group builder for the encounter tables
+_WILDERNESS_GROUP = functools.partial(create_kobold_group, 'wilderness')
 
 # Monster encounter tables
 WILDERNESS_MONSTERS = {
     'forest': [
-        {'name': 'kobold', 'chance': 30, 'group_func': lambda: create_kobold_group('wilderness')},
+        {'name': 'kobold', 'chance': 30, 'group_func': _WILDERNESS_GROUP},
         # Add more monsters here later
     ],
     'mountains': [
-        {'name': 'kobold', 'chance': 40, 'group_func': lambda: create_kobold_group('wilderness')},
+        {'name': 'kobold', 'chance': 40, 'group_func': _WILDERNESS_GROUP},
     ],
     'plains': [
-        {'name': 'kobold', 'chance': 20, 'group_func': lambda: create_kobold_group('wilderness')},
+        {'name': 'kobold', 'chance': 20, 'group_func': _WILDERNESS_GROUP},
     ]
 }
 
+# Per-terrain (cumulative chances, group builders, total chance) for weighted picks
+_ENCOUNTER_TABLES = {
+    terrain: (
+        list(itertools.accumulate(entry['chance'] for entry in entries)),
+        [entry['group_func'] for entry in entries],
+        sum(entry['chance'] for entry in entries)
+    )
+    for terrain, entries in WILDERNESS_MONSTERS.items()
+}
+
 def generate_random_encounter(terrain='forest'):
     """Generate a random encounter based on terrain."""
-    monster_table = WILDERNESS_MONSTERS.get(terrain, WILDERNESS_MONSTERS['forest'])
+    encounter_table = _ENCOUNTER_TABLES.get(terrain)
+    if encounter_table is None:
+        encounter_table = _ENCOUNTER_TABLES['forest']
     
-    # Simple random selection for now
-    if monster_table:
-        encounter = random.choice(monster_table)
-        return encounter['group_func']()
+    # Weighted selection by each entry's chance
+    cumulative, group_funcs, total = encounter_table
+    if total > 0:
+        index = bisect.bisect(cumulative, rng.random() * total)
+        return group_funcs[index]()
     
     return []
\ No newline at end of file
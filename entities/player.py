@@ -3,18 +3,33 @@
 Player class using centralized ASCII definitions with building system support.
 """
 from entities.character import Character
-from ui.ascii_definitions import ASCII_DEFS
+from ui.ascii_definitions import ASCII_DEFS, ColorPulse, CharacterCycle
+
+# Player appearance from ASCII definitions, resolved once at import
+_PLAYER_DEF = ASCII_DEFS.get_entity('player')
+_PLAYER_CHAR = _PLAYER_DEF['char']  # Can be '@' or '웃'
+_PLAYER_COLOR = _PLAYER_DEF['color']
+
+# Visual effects: effect type -> (effect attribute, factory taking the player)
+_PLAYER_EFFECTS = {
+    'blessed': ('color_effect', lambda player: ColorPulse(player.color, (255, 255, 255), duration=2000, repeat=True)),
+    'cursed': ('color_effect', lambda player: ColorPulse(player.color, (255, 0, 0), duration=1000, repeat=True)),
+    'hasted': ('char_effect', lambda player: CharacterCycle([player.char, '※', player.char], duration=500, repeat=True)),
+}
 
 class Player:
+    __slots__ = ('x', 'y', 'entity_id', 'char', 'color', 'character', 'location',
+                 'overworld_pos', 'color_effect', 'char_effect', '_render_info')
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
         self.entity_id = 'player'
         
-        # Get character and color from ASCII definitions
-        player_def = ASCII_DEFS.get_entity('player')
-        self.char = player_def['char']  # Can be '@' or '웃'
-        self.color = player_def['color']
+        # Character and color from ASCII definitions
+        self.char = _PLAYER_CHAR
+        self.color = _PLAYER_COLOR
+        self._render_info = (_PLAYER_CHAR, _PLAYER_COLOR)
         
         self.character = Character()
         self.location = 'overworld'  # 'overworld', 'building_interior', 'dungeon'
@@ -26,56 +41,50 @@ class Player:
 
     def add_visual_effect(self, effect_type):
         """Add a visual effect to the player."""
-        if effect_type == 'blessed':
-            from ui.ascii_definitions import ColorPulse
-            self.color_effect = ColorPulse(self.color, (255, 255, 255), duration=2000, repeat=True)
-            self.color_effect.start()
-        elif effect_type == 'cursed':
-            from ui.ascii_definitions import ColorPulse
-            self.color_effect = ColorPulse(self.color, (255, 0, 0), duration=1000, repeat=True)
-            self.color_effect.start()
-        elif effect_type == 'hasted':
-            from ui.ascii_definitions import CharacterCycle
-            self.char_effect = CharacterCycle([self.char, '※', self.char], duration=500, repeat=True)
-            self.char_effect.start()
+        entry = _PLAYER_EFFECTS.get(effect_type)
+        if entry:
+            attr, factory = entry
+            effect = factory(self)
+            effect.start()
+            setattr(self, attr, effect)
 
     def get_render_info(self):
-        """Get current rendering information with effects."""
+        """Get the current (char, color) pair for rendering, with effects."""
+        color_effect = self.color_effect
+        char_effect = self.char_effect
+        
+        # Fast path: without effects the base appearance never changes
+        if color_effect is None and char_effect is None:
+            return self._render_info
+        
         char = self.char
         color = self.color
         
         # Apply color effects
-        if self.color_effect and self.color_effect.active:
-            self.color_effect.update()
-            color = self.color_effect.get_current_color()
+        if color_effect and color_effect.active:
+            color_effect.update()
+            color = color_effect.get_current_color()
         
         # Apply character effects
-        if self.char_effect and self.char_effect.active:
-            self.char_effect.update()
-            char = self.char_effect.get_current_char()
+        if char_effect and char_effect.active:
+            char_effect.update()
+            char = char_effect.get_current_char()
         
-        return {'char': char, 'color': color}
+        return char, color
 
     def move(self, dx, dy, world):
         """Move the player and handle location transitions with building system support."""
         # Get current location info
         current_location = world.location_manager.current_location
         
-        if current_location == 'overworld':
-            current_map = world.overworld_tile_ids
+        if current_location == 'overworld' or current_location == 'dungeon':
             max_x = world.width
             max_y = world.height
         elif current_location == 'building_interior':
-            if world.building_manager.current_building:
-                current_map = world.building_manager.current_building['interior_map']
-                max_x = world.building_manager.current_building['interior_size'][0]
-                max_y = world.building_manager.current_building['interior_size'][1]
-            else:
+            building = world.building_manager.current_building
+            if not building:
                 return  # No building to move in
-        elif current_location == 'dungeon':
-            current_map = world.dungeon_tile_ids
-            max_x = world.width
-            max_y = world.height
+            max_x, max_y = building['interior_size']
         else:
             return
             
@@ -96,32 +105,42 @@ class Player:
 
     def equip(self, item_index):
         """Equip an item from inventory."""
-        if 0 <= item_index < len(self.character.inventory):
-            item = self.character.inventory[item_index]
+        inventory = self.character.inventory
+        if 0 <= item_index < len(inventory):
+            item = inventory[item_index]
+            equipped = self.character.equipped
+            current_weapon = equipped.weapon
+            current_shield = equipped.shield
             
             # Handle gloves (can equip to either hand)
             if item.slot == 'left_glove':
-                base = 'glove'
-                slot_to_equip = f'left_{base}' if not self.character.equipped[f'left_{base}'] else f'right_{base}'
+                slot_to_equip = 'left_glove' if not equipped.left_glove else 'right_glove'
             else:
                 slot_to_equip = item.slot
             
-            # Unequip existing item if present
-            if self.character.equipped[slot_to_equip]:
-                self.unequip(slot_to_equip)
+            # Return any item already in the slot to the inventory
+            existing = equipped[slot_to_equip]
+            if existing:
+                inventory.append(existing)
             
             # Handle two-handed weapons
-            if item.item_type == 'weapon' and item.hands == 2 and self.character.equipped['shield']:
-                self.unequip('shield')
+            if item.item_type == 'weapon' and item.hands == 2 and current_shield:
+                inventory.append(current_shield)
+                equipped.shield = None
             
             # Handle shield conflicts with two-handed weapons
-            if item.slot == 'shield' and self.character.equipped['weapon'] and self.character.equipped['weapon'].hands == 2:
-                self.unequip('weapon')
+            if item.slot == 'shield' and current_weapon and current_weapon.hands == 2:
+                inventory.append(current_weapon)
+                equipped.weapon = None
             
-            self.character.equipped[slot_to_equip] = self.character.inventory.pop(item_index)
+            equipped[slot_to_equip] = inventory.pop(item_index)
+            self.character.invalidate_ac()
 
     def unequip(self, slot):
         """Unequip an item and put it back in inventory."""
-        if self.character.equipped[slot]:
-            self.add_to_inventory(self.character.equipped[slot])
-            self.character.equipped[slot] = None
\ No newline at end of file
+        equipped = self.character.equipped
+        item = equipped[slot]
+        if item:
+            self.add_to_inventory(item)
+            equipped[slot] = None
+            self.character.invalidate_ac()
\ No newline at end of file
@@ -10,12 +10,15 @@ class Camera:
         self.y = 0
         self.view_width = view_width
         self.view_height = view_height
+        
+        # View extents in tiles never change, so resolve the offsets once
+        self._half_w = view_width / TILE_SIZE / 2
+        self._half_h = view_height / TILE_SIZE / 2
+        self._max_x = WORLD_WIDTH - view_width / TILE_SIZE
+        self._max_y = WORLD_HEIGHT - view_height / TILE_SIZE
 
     def update(self, target):
         """Update camera position to follow the target."""
-        self.x = target.x - (self.view_width / TILE_SIZE / 2)
-        self.y = target.y - (self.view_height / TILE_SIZE / 2)
-        
-        # Keep camera within world bounds
-        self.x = max(0, min(self.x, WORLD_WIDTH - self.view_width / TILE_SIZE))
-        self.y = max(0, min(self.y, WORLD_HEIGHT - self.view_height / TILE_SIZE))
\ No newline at end of file
+        # Center on the target, keeping the camera within world bounds
+        self.x = max(0, min(target.x - self._half_w, self._max_x))
+        self.y = max(0, min(target.y - self._half_h, self._max_y))
\ No newline at end of file
@@ -10,10 +10,51 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from systems.encounters import EncounterManager, EncounterDisplay
-from systems.combat import CombatManager
+from systems.combat import CombatManager, CombatPhase
+from systems.dice import randint
+
+# Overworld tile glyph -> encounter terrain type; water ('~') never has encounters
+_WATER_TILE = '~'
+_TERRAIN_MAP = {
+    '"': 'forest',    # Forest
+    '#': 'mountains', # Mountains
+    ',': 'plains'     # Grass/plains
+}
+
+# Interned action names; incoming actions are interned so lookups hit by identity
+_ACT_APPROACH = sys.intern("Approach the monsters")
+_ACT_AVOID = sys.intern("Try to avoid them")
+_ACT_WAIT = sys.intern("Wait and observe")
+_ACT_COMMUNICATE = sys.intern("Try to communicate")
+_ACT_PREPARE = sys.intern("Prepare for combat")
+_ACT_FLEE = sys.intern("Attempt to flee")
+_ACT_FIGHT = sys.intern("Fight!")
+_ACT_FLEE_COMBAT = sys.intern("Attempt to flee from combat")
+_ACT_ATTACK = sys.intern("Attack")
+_ACT_CAST_SPELL = sys.intern("Cast spell")
+_ACT_MOVE = sys.intern("Move")
+_ACT_OTHER = sys.intern("Other action")
+_ACT_SURPRISED = sys.intern("You cannot act this round!")
+
+# Surprise round actions; all of them simply move on to normal combat
+_SURPRISE_ACTIONS = frozenset((_ACT_ATTACK, _ACT_CAST_SPELL, _ACT_MOVE, _ACT_OTHER))
+
+_CMB_MELEE_ATTACK = sys.intern('Melee Attack')
+_CMB_MISSILE_ATTACK = sys.intern('Missile Attack')
+
+# Combat actions that only report a result action back to the game loop
+_COMBAT_RESULT_ACTIONS = {
+    sys.intern('Move'): 'player_move',
+    sys.intern('Wait'): 'player_wait',
+    sys.intern('Retreat'): 'attempt_retreat',
+    sys.intern('Fighting Withdrawal'): 'fighting_withdrawal',
+    sys.intern('Cast Declared Spell'): 'cast_spell'
+}
 
 class EncounterEventHandler:
     """Handles events during encounters and combat."""
+    __slots__ = ('encounter_manager', 'combat_manager', 'selected_option', 'selected_action',
+                 '_encounter_actions', '_combat_actions')
     
     def __init__(self):
         self.encounter_manager = EncounterManager()
@@ -21,79 +62,102 @@ class EncounterEventHandler:
         self.selected_option = 0
         self.selected_action = 0
         
+        # Action dispatch tables; several encounter actions share a handler
+        self._encounter_actions = {
+            _ACT_APPROACH: self._action_approach,
+            _ACT_AVOID: self._action_evade,
+            _ACT_WAIT: self._action_approach,
+            _ACT_COMMUNICATE: self._action_communicate,
+            _ACT_PREPARE: self._action_prepare_for_combat,
+            _ACT_FLEE: self._action_evade,
+            _ACT_FIGHT: self._action_fight,
+            _ACT_FLEE_COMBAT: self._action_flee_combat,
+            _ACT_SURPRISED: self._action_begin_combat
+        }
+        self._encounter_actions.update(dict.fromkeys(_SURPRISE_ACTIONS, self._action_begin_combat))
+        self._combat_actions = {
+            _CMB_MELEE_ATTACK: self._combat_melee_attack,
+            _CMB_MISSILE_ATTACK: self._combat_missile_attack
+        }
+        
     def handle_encounter_input(self, event, encounter, player):
-        """Handle input during encounter phase."""
-        if event.type == pygame.KEYDOWN:
-            options = EncounterDisplay.get_encounter_options(encounter)
-            
-            if event.key == pygame.K_UP:
-                self.selected_option = (self.selected_option - 1) % len(options)
-            elif event.key == pygame.K_DOWN:
-                self.selected_option = (self.selected_option + 1) % len(options)
-            elif event.key == pygame.K_RETURN:
-                return self.process_encounter_action(encounter, player, options[self.selected_option])
-            elif event.key == pygame.K_ESCAPE:
-                # Try to flee if possible
-                if self.encounter_manager.can_attempt_evasion(encounter):
-                    return self.attempt_evasion(encounter)
+        """Handle a key press during encounter phase."""
+        options = self.get_encounter_options(encounter)
+        
+        if event.key == pygame.K_UP:
+            self.selected_option = (self.selected_option - 1) % len(options)
+        elif event.key == pygame.K_DOWN:
+            self.selected_option = (self.selected_option + 1) % len(options)
+        elif event.key == pygame.K_RETURN:
+            return self.process_encounter_action(encounter, player, options[self.selected_option])
+        elif event.key == pygame.K_ESCAPE:
+            # Try to flee if possible
+            if self.encounter_manager.can_attempt_evasion(encounter):
+                return self.attempt_evasion(encounter)
         
         return None
     
+    def get_encounter_options(self, encounter):
+        """Get the encounter's options, rebuilt only when its phase or reaction changes."""
+        options_key = (encounter['phase'], encounter.get('reaction'))
+        cached = encounter.get('_options')
+        if cached is None or cached[0] != options_key:
+            options = [sys.intern(option) for option in EncounterDisplay.get_encounter_options(encounter)]
+            cached = encounter['_options'] = (options_key, options)
+        return cached[1]
+    
     def process_encounter_action(self, encounter, player, action):
         """Process the selected encounter action."""
-        if action == "Approach the monsters":
-            # Move to reaction phase
-            encounter['phase'] = 'reaction'
-            encounter = self.encounter_manager.check_surprise(encounter, player)
-            if encounter['phase'] == 'reaction':
-                encounter = self.encounter_manager.roll_monster_reaction(
-                    encounter, player.character.get_modifier(player.character.ability_scores['cha']))
-            return {'action': 'continue_encounter', 'encounter': encounter}
-        
-        elif action == "Try to avoid them":
-            return self.attempt_evasion(encounter)
-        
-        elif action == "Wait and observe":
-            # Move to reaction phase (monsters notice you)
-            encounter['phase'] = 'reaction'
-            encounter = self.encounter_manager.check_surprise(encounter, player)
-            if encounter['phase'] == 'reaction':
-                encounter = self.encounter_manager.roll_monster_reaction(
-                    encounter, player.character.get_modifier(player.character.ability_scores['cha']))
-            return {'action': 'continue_encounter', 'encounter': encounter}
-        
-        elif action == "Try to communicate":
-            # Roll reaction with Charisma bonus
-            cha_mod = player.character.get_modifier(player.character.ability_scores['cha'])
-            encounter = self.encounter_manager.roll_monster_reaction(encounter, cha_mod)
-            return {'action': 'continue_encounter', 'encounter': encounter}
-        
-        elif action == "Prepare for combat":
-            encounter['combat_started'] = True
-            encounter['phase'] = 'combat'
-            return {'action': 'start_combat', 'encounter': encounter}
-        
-        elif action == "Attempt to flee":
-            return self.attempt_evasion(encounter)
-        
-        elif action == "Fight!":
-            return {'action': 'start_combat', 'encounter': encounter}
-        
-        elif action == "Attempt to flee from combat":
-            return self.attempt_combat_evasion(encounter)
-        
-        elif action in ["Attack", "Cast spell", "Move", "Other action"]:
-            # Handle surprise round actions
-            encounter['phase'] = 'combat'
-            return {'action': 'start_combat', 'encounter': encounter}
-        
-        elif action == "You cannot act this round!":
-            # Skip surprise round, move to normal combat
-            encounter['phase'] = 'combat'
-            return {'action': 'start_combat', 'encounter': encounter}
-        
+        handler = self._encounter_actions.get(sys.intern(action))
+        if handler:
+            return handler(encounter, player)
         return None
     
+    def _action_approach(self, encounter, player):
+        """Move to reaction phase (monsters notice you)."""
+        return {'action': 'continue_encounter', 'encounter': self._enter_reaction_phase(encounter, player)}
+    
+    def _enter_reaction_phase(self, encounter, player):
+        """Check surprise, then roll monster reaction if nobody was surprised."""
+        encounter['phase'] = 'reaction'
+        encounter = self.encounter_manager.check_surprise(encounter, player)
+        if encounter['phase'] == 'reaction':
+            encounter = self.encounter_manager.roll_monster_reaction(encounter, self._cha_modifier(player))
+        return encounter
+    
+    def _cha_modifier(self, player):
+        """Get the player's Charisma reaction modifier."""
+        character = player.character
+        return character.get_modifier(character.ability_scores['cha'])
+    
+    def _action_evade(self, encounter, player):
+        """Try to slip away from the encounter."""
+        return self.attempt_evasion(encounter)
+    
+    def _action_communicate(self, encounter, player):
+        """Roll reaction with Charisma bonus."""
+        encounter = self.encounter_manager.roll_monster_reaction(encounter, self._cha_modifier(player))
+        return {'action': 'continue_encounter', 'encounter': encounter}
+    
+    def _action_prepare_for_combat(self, encounter, player):
+        """Ready for combat and start it."""
+        encounter['combat_started'] = True
+        encounter['phase'] = 'combat'
+        return {'action': 'start_combat', 'encounter': encounter}
+    
+    def _action_fight(self, encounter, player):
+        """Start combat without changing the encounter phase."""
+        return {'action': 'start_combat', 'encounter': encounter}
+    
+    def _action_flee_combat(self, encounter, player):
+        """Try to flee once combat is under way."""
+        return self.attempt_combat_evasion(encounter)
+    
+    def _action_begin_combat(self, encounter, player):
+        """Leave the surprise round and move to normal combat."""
+        encounter['phase'] = 'combat'
+        return {'action': 'start_combat', 'encounter': encounter}
+    
     def attempt_evasion(self, encounter):
         """Attempt to evade the encounter."""
         if self.encounter_manager.attempt_evasion(encounter):
@@ -117,8 +181,7 @@ class EncounterEventHandler:
         # This is a simplified version
         evasion_chance = 30  # Base 30% in combat
         
-        import random
-        if random.randint(1, 100) <= evasion_chance:
+        if randint(1, 100) <= evasion_chance:
             return {
                 'action': 'combat_evasion_success',
                 'message': "You successfully flee from combat!"
@@ -131,15 +194,14 @@ class EncounterEventHandler:
             }
     
     def handle_combat_input(self, event, player, monsters, combat_phase):
-        """Handle input during combat phase."""
-        if event.type == pygame.KEYDOWN:
-            if combat_phase == 'declare_spells':
-                return self.handle_spell_declaration(event)
-            elif combat_phase == 'player_turn':
-                return self.handle_player_combat_turn(event, player, monsters)
-            elif combat_phase == 'monster_turn':
-                # Monster turn is automatic
-                return {'action': 'monster_turn'}
+        """Handle a key press during combat phase."""
+        if combat_phase == CombatPhase.DECLARE_SPELLS:
+            return self.handle_spell_declaration(event)
+        elif combat_phase == CombatPhase.PLAYER_TURN:
+            return self.handle_player_combat_turn(event, player, monsters)
+        elif combat_phase == CombatPhase.MONSTER_TURN:
+            # Monster turn is automatic
+            return {'action': 'monster_turn'}
         
         return None
     
@@ -156,7 +218,7 @@ class EncounterEventHandler:
     def handle_player_combat_turn(self, event, player, monsters):
         """Handle player's combat turn input."""
         available_actions = self.combat_manager.get_available_actions(
-            player, monsters, 'player_turn')
+            player, monsters, CombatPhase.PLAYER_TURN)
         
         if event.key == pygame.K_UP:
             self.selected_action = (self.selected_action - 1) % len(available_actions)
@@ -172,64 +234,54 @@ class EncounterEventHandler:
     
     def process_combat_action(self, action, player, monsters):
         """Process the selected combat action."""
-        if action == 'Melee Attack':
-            # Find the first alive monster to attack
-            target = next((m for m in monsters if m.is_alive), None)
-            if target:
-                attack_result = self.combat_manager.make_attack(player, target, 'melee')
-                return {
-                    'action': 'player_attack',
-                    'target': target,
-                    'result': attack_result
-                }
+        action = sys.intern(action)
+        handler = self._combat_actions.get(action)
+        if handler:
+            return handler(player, monsters)
+        
+        result_action = _COMBAT_RESULT_ACTIONS.get(action)
+        if result_action:
+            return {'action': result_action}
         
-        elif action == 'Missile Attack':
-            # Find the first alive monster to attack
-            target = next((m for m in monsters if m.is_alive), None)
-            if target:
-                attack_result = self.combat_manager.make_attack(player, target, 'missile')
+        return None
+    
+    def _combat_melee_attack(self, player, monsters):
+        """Make a melee attack against the first alive monster."""
+        return self._attack_first_alive(player, monsters, 'melee')
+    
+    def _combat_missile_attack(self, player, monsters):
+        """Make a missile attack against the first alive monster."""
+        return self._attack_first_alive(player, monsters, 'missile')
+    
+    def _attack_first_alive(self, player, monsters, attack_type):
+        """Attack the first alive monster with the given attack type."""
+        # The game loop passes alive-filtered monsters, so this normally stops at the first
+        for target in monsters:
+            if target.is_alive:
+                attack_result = self.combat_manager.make_attack(player, target, attack_type)
                 return {
                     'action': 'player_attack',
                     'target': target,
                     'result': attack_result
                 }
-        
-        elif action == 'Move':
-            return {'action': 'player_move'}
-        
-        elif action == 'Wait':
-            return {'action': 'player_wait'}
-        
-        elif action == 'Retreat':
-            return {'action': 'attempt_retreat'}
-        
-        elif action == 'Fighting Withdrawal':
-            return {'action': 'fighting_withdrawal'}
-        
-        elif action == 'Cast Declared Spell':
-            return {'action': 'cast_spell'}
-        
         return None
     
     def check_for_encounter(self, player, world, current_time):
         """Check if a random encounter should occur."""
+        # Fast path: nothing to do until the next check is due
+        if current_time < self.encounter_manager.next_check_time:
+            return None
+        
         if not self.encounter_manager.should_check_for_encounter(current_time, player.location):
             return None
         
         # Determine terrain type from player's current position
         if player.location == 'overworld':
             current_tile = world.overworld_tiles[player.y][player.x]
-            terrain_map = {
-                '"': 'forest',    # Forest
-                '#': 'mountains', # Mountains
-                ',': 'plains',    # Grass/plains
-                '~': 'water'      # Water (no encounters)
-            }
-            terrain = terrain_map.get(current_tile, 'plains')
-            
-            if terrain == 'water':
+            if current_tile == _WATER_TILE:
                 return None  # No encounters on water
             
+            terrain = _TERRAIN_MAP.get(current_tile, 'plains')
             encounter = self.encounter_manager.check_for_encounter(terrain)
             if encounter:
                 self.selected_option = 0  # Reset selection
@@ -4,24 +4,35 @@ Event handling for the ASCII RPG game.
 """
 import pygame
 from config import MOVE_DELAY
+from entities.character import EQUIPMENT_SLOTS
+from ui.panels import PanelState
+
+# Movement keys in priority order: (key, dx, dy)
+_MOVE_KEYS = (
+    (pygame.K_UP, 0, -1), (pygame.K_w, 0, -1),
+    (pygame.K_DOWN, 0, 1), (pygame.K_s, 0, 1),
+    (pygame.K_LEFT, -1, 0), (pygame.K_a, -1, 0),
+    (pygame.K_RIGHT, 1, 0), (pygame.K_d, 1, 0)
+)
+
+# Looking mode cursor deltas and exit keys
+_LOOK_DELTAS = {key: (dx, dy) for key, dx, dy in _MOVE_KEYS}
+_LOOK_EXIT_KEYS = frozenset((pygame.K_l, pygame.K_ESCAPE))
 
 class EventHandler:
+    __slots__ = ('last_move_time',)
+    
     def __init__(self):
         self.last_move_time = 0
     
     def handle_looking_mode(self, event, look_cursor_pos, game_state):
-        """Handle events while in looking mode."""
-        if event.type == pygame.KEYDOWN:
-            if event.key in [pygame.K_UP, pygame.K_w]:
-                look_cursor_pos[1] -= 1
-            elif event.key in [pygame.K_DOWN, pygame.K_s]:
-                look_cursor_pos[1] += 1
-            elif event.key in [pygame.K_LEFT, pygame.K_a]:
-                look_cursor_pos[0] -= 1
-            elif event.key in [pygame.K_RIGHT, pygame.K_d]:
-                look_cursor_pos[0] += 1
-            elif event.key in [pygame.K_l, pygame.K_ESCAPE]:
-                return 'playing'
+        """Handle key presses while in looking mode."""
+        delta = _LOOK_DELTAS.get(event.key)
+        if delta:
+            look_cursor_pos[0] += delta[0]
+            look_cursor_pos[1] += delta[1]
+        elif event.key in _LOOK_EXIT_KEYS:
+            return 'playing'
         return game_state
     
     def handle_prompt_mode(self, event, game_state, pending_action):
@@ -38,11 +49,12 @@ class EventHandler:
     def handle_item_prompt(self, event, world, player):
         """Handle item pickup prompts."""
         if event.type == pygame.KEYDOWN:
-            chest = next((c for c in world.treasure_chests if c['pos'] == (player.x, player.y)), None)
+            pos = (player.x, player.y)
+            chest = world.treasure_chests.get(pos)
             if event.key == pygame.K_y and chest:
                 player.add_to_inventory(chest['item'])
-                world.dungeon_tiles[chest['pos'][1]][chest['pos'][0]] = '.'
-                world.treasure_chests.remove(chest)
+                world.dungeon_tiles[pos[1]][pos[0]] = '.'
+                del world.treasure_chests[pos]
             return 'playing'
         return 'item_prompt'
     
@@ -58,7 +70,7 @@ class EventHandler:
                 if ui_focus == 'inventory':
                     new_cursor = min(len(player.character.inventory) - 1, ui_cursor + 1)
                 else:
-                    new_cursor = min(len(player.character.equipped) - 1, ui_cursor + 1)
+                    new_cursor = min(len(EQUIPMENT_SLOTS) - 1, ui_cursor + 1)
             elif event.key == pygame.K_LEFT or event.key == pygame.K_RIGHT:
                 new_focus = 'equipment' if ui_focus == 'inventory' else 'inventory'
                 new_cursor = 0
@@ -72,7 +84,7 @@ class EventHandler:
         if ui_focus == 'inventory' and player.character.inventory:
             return 'inventory', ui_cursor, 'equip_prompt', lambda c=ui_cursor: player.equip(c)
         elif ui_focus == 'equipment':
-            slot = list(player.character.equipped.keys())[ui_cursor]
+            slot = EQUIPMENT_SLOTS[ui_cursor]
             if player.character.equipped[slot]:
                 return 'equipment', ui_cursor, 'unequip_prompt', lambda s=slot: player.unequip(s)
         return ui_focus, ui_cursor, None, None
@@ -86,35 +98,23 @@ class EventHandler:
                 return {'game_state': 'looking', 'look_cursor_pos': [player.x, player.y]}
             if event.key == pygame.K_c:
                 status_panel.toggle()
-                if status_panel.state == 'OPENING':
-                    inventory_panel.state = 'CLOSING'
+                if status_panel.state == PanelState.OPENING:
+                    inventory_panel.state = PanelState.CLOSING
             if event.key == pygame.K_i:
                 inventory_panel.toggle()
-                if inventory_panel.state == 'OPENING':
-                    status_panel.state = 'CLOSING'
+                if inventory_panel.state == PanelState.OPENING:
+                    status_panel.state = PanelState.CLOSING
         
         return {}
     
-    def handle_movement(self, player, world):
-        """Handle player movement input."""
-        keys = pygame.key.get_pressed()
-        current_time = pygame.time.get_ticks()
-        
+    def handle_movement(self, player, world, current_time):
+        """Handle player movement input by polling the held movement keys."""
         if current_time - self.last_move_time > MOVE_DELAY:
-            dx, dy = 0, 0
-            
-            if keys[pygame.K_UP] or keys[pygame.K_w]:
-                dy = -1
-            elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                dy = 1
-            elif keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                dx = -1
-            elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                dx = 1
-            
-            if dx != 0 or dy != 0:
-                player.move(dx, dy, world)
-                self.last_move_time = current_time
-                return True
+            keys = pygame.key.get_pressed()
+            for key, dx, dy in _MOVE_KEYS:
+                if keys[key]:
+                    player.move(dx, dy, world)
+                    self.last_move_time = current_time
+                    return True
         
         return False
\ No newline at end of file
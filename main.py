@@ -3,8 +3,11 @@
 ASCII RPG with complete encounter, combat system, and building system using centralized ASCII definitions.
 """
 import pygame
+from pygame.locals import QUIT, KEYDOWN, K_1, K_2, K_3, K_4, K_RETURN, K_s
 import sys
 import os
+import heapq
+import itertools
 
 # Add the current directory to the Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -23,15 +26,16 @@ from ui.colors import (
 )
 
 # Import ASCII definitions
-from ui.ascii_definitions import ASCII_DEFS
+from ui.ascii_definitions import ASCII_DEFS, render_glyph
 
 # Import other modules
 from ui.panels import (
-    SlidingPanel, draw_status_panel, draw_inventory_panel,
+    PanelState, SlidingPanel, draw_status_panel, draw_inventory_panel,
     draw_action_prompt, draw_confirmation_box
 )
 from ui.menus import MenuManager
 from entities.player import Player
+from entities.character import EQUIPMENT_SLOTS
 from world.world import World
 from game.camera import Camera
 from game.events import EventHandler
@@ -40,30 +44,56 @@ from systems.save_system import SaveSystem
 
 # Import encounter system
 from game.encounter_events import EncounterEventHandler
+from systems.combat import CombatPhase
 from systems.encounters import EncounterDisplay
 from ui.encounter_ui import draw_encounter_screen, draw_encounter_options, draw_combat_screen, draw_combat_actions, draw_combat_help
 
+# Demo spell keys: key -> (spell type, target x offset from the player)
+_SPELL_KEYS = {
+    K_1: ('fireball', 0),
+    K_2: ('magic_missile', 1),
+    K_3: ('heal', 0)
+}
+
+# Event types the state handlers consume
+_HANDLED_EVENTS = (QUIT, KEYDOWN)
+
 class Game:
     """Main game class that manages all game states with visual effects and building system."""
     
     def __init__(self):
         pygame.init()
         
-        # Initialize fonts
-        try:
-            if FONT_NAME:
-                self.ui_font = pygame.font.Font(FONT_NAME, FONT_SIZE)
-                self.tile_font = pygame.font.Font(FONT_NAME, TILE_FONT_SIZE)
-            else:
-                raise FileNotFoundError
-        except FileNotFoundError:
+        # Initialize fonts, falling back to the system monospace font
+        if FONT_NAME and os.path.isfile(FONT_NAME):
+            self.ui_font = pygame.font.Font(FONT_NAME, FONT_SIZE)
+            self.tile_font = pygame.font.Font(FONT_NAME, TILE_FONT_SIZE)
+        else:
             self.ui_font = pygame.font.SysFont('monospace', FONT_SIZE, bold=True)
             self.tile_font = pygame.font.SysFont('monospace', TILE_FONT_SIZE, bold=True)
         
         # Initialize display
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.world_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.world_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
         pygame.display.set_caption("ASCII RPG")
+        
+        # Static text never changes, so render it once up front
+        self.help_surf = self.ui_font.render(
+            "Spells: 1-Fireball 2-Magic Missile 3-Heal 4-Smoke | ENTER-Interact",
+            True, C_TEXT_DIM).convert_alpha()
+        self.encounter_fallback_surf = self.ui_font.render(
+            "ENCOUNTER! Press ESC to flee.", True, C_TEXT).convert_alpha()
+        self.combat_fallback_surf = self.ui_font.render(
+            "COMBAT! Press ESC to attempt retreat.", True, C_TEXT).convert_alpha()
+        
+        # Movement polls held keys each frame, so key repeat would only flood the queue
+        pygame.key.set_repeat()
+        
+        # The game is keyboard-only; keep unused events out of the queue.
+        # TEXTINPUT stays enabled since pygame fills KEYDOWN.unicode from it.
+        pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                                  pygame.MOUSEWHEEL, pygame.ACTIVEEVENT, pygame.VIDEOEXPOSE,
+                                  pygame.KEYUP])
         self.clock = pygame.time.Clock()
         
         # Game state
@@ -94,16 +124,52 @@ class Game:
         self.pending_action = None
         self.look_cursor_pos = [0, 0]
         
+        # Tile prompt/description text keyed by (x, y, location); cleared when the world changes
+        self._prompt_cache = {}
+        self._description_cache = {}
+        
         # Visual effects
-        self.spell_effects = []  # List of active spell effects
+        self.frame_time = 0  # Tick count sampled once per update
+        self.cursor_blink_on = True  # Look cursor visibility, toggled every 400 ms
+        self.spell_effects = []  # Heap of (expire_time, seq, effect) for active spell effects
+        self._spell_effect_seq = itertools.count()  # Tie-breaker for equal expiry times
+        
+        # Dispatch tables: game state -> event handler, handler result action -> response
+        self._state_handlers = {
+            'menu': self.handle_menu_events,
+            'character_creation': self.handle_character_creation_events,
+            'playing': self.handle_playing_events,
+            'encounter': self.handle_encounter_events,
+            'combat': self.handle_combat_events
+        }
+        self._encounter_results = {
+            'continue_encounter': self._continue_encounter,
+            'start_combat': lambda result: self.start_combat(),
+            'evasion_success': self._encounter_evaded,
+            'evasion_failed': self._evasion_failed
+        }
+        self._combat_results = {
+            'spells_declared': self._spells_declared,
+            'player_attack': self.process_player_attack,
+            'monster_turn': lambda result: self.process_monster_turn(),
+            'player_move': self._end_player_turn,
+            'player_wait': self._end_player_turn,
+            'attempt_retreat': lambda result: self.attempt_combat_retreat()
+        }
 
     def run(self):
         """Main game loop."""
+        # Bind the per-frame calls once; only the running flag changes between frames
+        handle_events = self.handle_events
+        update = self.update
+        draw = self.draw
+        tick = self.clock.tick
+        
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(60)
+            handle_events()
+            update()
+            draw()
+            tick(60)
         
         pygame.quit()
 
@@ -113,12 +179,13 @@ class Game:
             # Add effect to world tile
             self.world.add_spell_effect(x, y, self.player.location, effect_type)
             
-            # Add to our tracking list
-            self.spell_effects.append({
+            # Add to our tracking heap, ordered by expiry time
+            start_time = pygame.time.get_ticks()
+            heapq.heappush(self.spell_effects, (start_time + duration, next(self._spell_effect_seq), {
                 'x': x, 'y': y, 'type': effect_type,
-                'start_time': pygame.time.get_ticks(),
+                'start_time': start_time,
                 'duration': duration
-            })
+            }))
 
     def add_entity_effect(self, entity, effect_type):
         """Add a visual effect to an entity (player or monster)."""
@@ -128,12 +195,11 @@ class Game:
     def cast_spell(self, spell_type, target_x, target_y):
         """Cast a spell with visual effects."""
         if spell_type == 'fireball':
-            # Add fire effect to target area
-            for dx in range(-1, 2):
-                for dy in range(-1, 2):
-                    fx, fy = target_x + dx, target_y + dy
-                    if 0 <= fx < self.world.width and 0 <= fy < self.world.height:
-                        self.add_spell_effect(fx, fy, 'fire', 2000)
+            # Add fire effect to the 3x3 target area, clipped to the world bounds
+            y_range = range(max(0, target_y - 1), min(self.world.height, target_y + 2))
+            for fx in range(max(0, target_x - 1), min(self.world.width, target_x + 2)):
+                for fy in y_range:
+                    self.add_spell_effect(fx, fy, 'fire', 2000)
         
         elif spell_type == 'magic_missile':
             # Add magic missile effect
@@ -146,21 +212,19 @@ class Game:
 
     def handle_events(self):
         """Handle all events based on current state."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        # Every state handler only reacts to key presses, so fetch just those
+        # (plus quit requests) and drop the rest of the queue in one call
+        events = pygame.event.get(_HANDLED_EVENTS)
+        pygame.event.clear(pump=False)
+        
+        for event in events:
+            if event.type == QUIT:
                 self.running = False
                 continue
             
-            if self.state == 'menu':
-                self.handle_menu_events(event)
-            elif self.state == 'character_creation':
-                self.handle_character_creation_events(event)
-            elif self.state == 'playing':
-                self.handle_playing_events(event)
-            elif self.state == 'encounter':
-                self.handle_encounter_events(event)
-            elif self.state == 'combat':
-                self.handle_combat_events(event)
+            handler = self._state_handlers.get(self.state)
+            if handler:
+                handler(event)
 
     def handle_encounter_events(self, event):
         """Handle encounter events."""
@@ -169,55 +233,74 @@ class Game:
                 event, self.current_encounter, self.player)
             
             if result:
-                if result['action'] == 'continue_encounter':
-                    self.current_encounter = result['encounter']
-                elif result['action'] == 'start_combat':
-                    self.start_combat()
-                elif result['action'] == 'evasion_success':
-                    self.state = 'playing'
-                    self.current_encounter = None
-                elif result['action'] == 'evasion_failed':
-                    self.current_encounter = result['encounter']
-                    self.start_combat()
+                respond = self._encounter_results.get(result['action'])
+                if respond:
+                    respond(result)
         except Exception as e:
             # Fallback to playing state on error
             self.state = 'playing'
             self.current_encounter = None
 
+    def _continue_encounter(self, result):
+        """Keep the encounter going with its updated state."""
+        self.current_encounter = result['encounter']
+
+    def _encounter_evaded(self, result):
+        """Return to the map after a successful evasion."""
+        self.state = 'playing'
+        self.current_encounter = None
+
+    def _evasion_failed(self, result):
+        """Fall into combat after a failed evasion."""
+        self.current_encounter = result['encounter']
+        self.start_combat()
+
+    def get_alive_monsters(self):
+        """Get the living monsters of the current encounter, cached on the encounter."""
+        alive_monsters = self.current_encounter.get('_alive')
+        if alive_monsters is None:
+            alive_monsters = self.current_encounter['_alive'] = [
+                m for m in self.current_encounter['monsters'] if m.is_alive]
+        return alive_monsters
+
+    def invalidate_alive_monsters(self):
+        """Drop the cached living monsters after an action that may kill or rout some."""
+        self.current_encounter.pop('_alive', None)
+
     def handle_combat_events(self, event):
         """Handle combat events."""
         try:
-            alive_monsters = [m for m in self.current_encounter['monsters'] if m.is_alive]
+            alive_monsters = self.get_alive_monsters()
             
             result = self.encounter_handler.handle_combat_input(
                 event, self.player, alive_monsters, self.combat_phase)
             
             if result:
-                if result['action'] == 'spells_declared':
-                    self.combat_phase = 'player_turn'
-                elif result['action'] == 'player_attack':
-                    self.process_player_attack(result)
-                elif result['action'] == 'monster_turn':
-                    self.process_monster_turn()
-                elif result['action'] == 'player_move':
-                    self.combat_phase = 'monster_turn'
-                elif result['action'] == 'player_wait':
-                    self.combat_phase = 'monster_turn'
-                elif result['action'] == 'attempt_retreat':
-                    self.attempt_combat_retreat()
+                self.invalidate_alive_monsters()
+                respond = self._combat_results.get(result['action'])
+                if respond:
+                    respond(result)
         except Exception as e:
             # Fallback to playing state on error
             self.state = 'playing'
             self.current_encounter = None
             self.combat_phase = None
 
+    def _spells_declared(self, result):
+        """Move on to the player's turn once spells are declared."""
+        self.combat_phase = CombatPhase.PLAYER_TURN
+
+    def _end_player_turn(self, result):
+        """Hand the round to the monsters."""
+        self.combat_phase = CombatPhase.MONSTER_TURN
+
     def start_combat(self):
         """Start combat with current encounter monsters."""
         try:
             self.state = 'combat'
-            alive_monsters = [m for m in self.current_encounter['monsters'] if m.is_alive]
+            alive_monsters = self.get_alive_monsters()
             combat_info = self.encounter_handler.combat_manager.start_combat(self.player, alive_monsters)
-            self.combat_phase = 'declare_spells'
+            self.combat_phase = CombatPhase.DECLARE_SPELLS
         except Exception as e:
             self.state = 'playing'
             self.current_encounter = None
@@ -226,13 +309,13 @@ class Game:
         """Process the result of a player attack."""
         try:
             # Check if combat should end
-            alive_monsters = [m for m in self.current_encounter['monsters'] if m.is_alive]
+            alive_monsters = self.get_alive_monsters()
             combat_check = self.encounter_handler.combat_manager.check_combat_end(self.player, alive_monsters)
             
             if combat_check['ended']:
                 self.end_combat(combat_check['result'])
             else:
-                self.combat_phase = 'monster_turn'
+                self.combat_phase = CombatPhase.MONSTER_TURN
         except Exception as e:
             self.state = 'playing'
             self.current_encounter = None
@@ -240,9 +323,10 @@ class Game:
     def process_monster_turn(self):
         """Process monster turn in combat."""
         try:
-            alive_monsters = [m for m in self.current_encounter['monsters'] if m.is_alive]
+            alive_monsters = self.get_alive_monsters()
             monster_results = self.encounter_handler.combat_manager.execute_monster_turn(
                 alive_monsters, self.player)
+            self.invalidate_alive_monsters()
             
             # Check if combat should end
             combat_check = self.encounter_handler.combat_manager.check_combat_end(self.player, alive_monsters)
@@ -253,7 +337,7 @@ class Game:
                 # Start new round
                 combat_info = self.encounter_handler.combat_manager.start_new_round(
                     self.player, alive_monsters)
-                self.combat_phase = 'declare_spells'
+                self.combat_phase = CombatPhase.DECLARE_SPELLS
         except Exception as e:
             self.state = 'playing'
             self.current_encounter = None
@@ -262,10 +346,8 @@ class Game:
         """End combat and return to playing state."""
         try:
             if result == 'player_victory':
-                # Award XP
-                defeated_monsters = [m for m in self.current_encounter['monsters'] if not m.is_alive]
-                xp_gained = self.encounter_handler.combat_manager.award_experience(
-                    self.player, defeated_monsters)
+                # Award XP for the monsters defeated during this combat
+                xp_gained = self.encounter_handler.combat_manager.award_experience(self.player)
             
             self.state = 'playing'
             self.current_encounter = None
@@ -319,8 +401,7 @@ class Game:
     def handle_playing_events(self, event):
         """Handle in-game events with building system support."""
         # Check if any panels are open
-        is_panel_open = (self.status_panel.state != 'CLOSED' or 
-                        self.inventory_panel.state != 'CLOSED')
+        is_panel_open = bool(self.status_panel.state or self.inventory_panel.state)
         
         # Handle different game states
         if self.game_state == 'looking':
@@ -334,24 +415,25 @@ class Game:
         elif self.game_state == 'item_prompt':
             self.game_state = self.event_handler.handle_item_prompt(
                 event, self.world, self.player)
+            self.clear_tile_text_cache()
         
         else:  # Main game state
             # Handle spell casting (demo keys)
-            if event.type == pygame.KEYDOWN and not is_panel_open:
-                if event.key == pygame.K_1:  # Fireball
-                    self.cast_spell('fireball', self.player.x, self.player.y)
-                elif event.key == pygame.K_2:  # Magic Missile
-                    self.cast_spell('magic_missile', self.player.x + 1, self.player.y)
-                elif event.key == pygame.K_3:  # Heal
-                    self.cast_spell('heal', self.player.x, self.player.y)
-                elif event.key == pygame.K_4:  # Smoke (demo)
+            if event.type == KEYDOWN and not is_panel_open:
+                spell = _SPELL_KEYS.get(event.key)
+                if spell:
+                    spell_type, offset_x = spell
+                    self.cast_spell(spell_type, self.player.x + offset_x, self.player.y)
+                elif event.key == K_4:  # Smoke (demo)
                     self.add_spell_effect(self.player.x, self.player.y, 'smoke', 3000)
                 
                 # Handle building/dungeon interactions
-                elif event.key == pygame.K_RETURN:
+                elif event.key == K_RETURN:
                     if self.world.handle_player_interaction(self.player):
                         # Location changed, update camera if needed
                         pass
+                    # Interactions can change location or tiles, so drop cached tile text
+                    self.clear_tile_text_cache()
             
             # Handle main game input
             result = self.event_handler.handle_main_game_input(
@@ -367,7 +449,7 @@ class Game:
                     self.look_cursor_pos = result['look_cursor_pos']
             
             # Handle save game (S key)
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_s and not is_panel_open:
+            if event.type == KEYDOWN and event.key == K_s and not is_panel_open:
                 self.quick_save()
             
             # Handle panel navigation
@@ -380,38 +462,64 @@ class Game:
                     self.game_state = new_game_state
                     self.pending_action = new_pending_action
 
+    def get_action_prompt(self, x, y):
+        """Get the world's action prompt for a tile, cached per location."""
+        key = (x, y, self.player.location)
+        prompt = self._prompt_cache.get(key)
+        if prompt is None:
+            prompt = self._prompt_cache[key] = self.world.get_action_prompt(x, y, self.player)
+        return prompt
+
+    def get_description(self, x, y):
+        """Get the world's description of a tile, cached per location."""
+        key = (x, y, self.player.location)
+        description = self._description_cache.get(key)
+        if description is None:
+            description = self._description_cache[key] = self.world.get_description(x, y, self.player)
+        return description
+
+    def clear_tile_text_cache(self):
+        """Forget cached prompts and descriptions after the world or location changes."""
+        self._prompt_cache.clear()
+        self._description_cache.clear()
+
     def update(self):
         """Update game logic based on current state."""
+        self.frame_time = pygame.time.get_ticks()
+        self.cursor_blink_on = not (self.frame_time // 400) & 1
+        
         if self.state == 'playing':
             self.update_playing()
         
-        # Update world tile effects
-        if self.world:
-            self.world.update_tile_effects()
-        
-        # Clean up expired spell effects
-        current_time = pygame.time.get_ticks()
-        self.spell_effects = [
-            effect for effect in self.spell_effects
-            if current_time - effect['start_time'] < effect['duration']
-        ]
+        # Clean up spell effects; visible tiles refresh their own ambient
+        # animations when drawn, so the world-wide pass only runs while spells are live
+        spell_effects = self.spell_effects
+        if spell_effects:
+            if self.world:
+                self.world.update_tile_effects()
+            
+            # Only the expired front of the heap is touched
+            current_time = self.frame_time
+            while spell_effects and spell_effects[0][0] <= current_time:
+                heapq.heappop(spell_effects)
 
     def update_playing(self):
         """Update playing state."""
         # Check if any panels are open
-        is_panel_open = (self.status_panel.state != 'CLOSED' or 
-                        self.inventory_panel.state != 'CLOSED')
+        is_panel_open = bool(self.status_panel.state or self.inventory_panel.state)
         
         if self.game_state == 'playing' and not is_panel_open:
+            player = self.player
+            world = self.world
+            
             # Handle movement
-            moved = self.event_handler.handle_movement(self.player, self.world)
+            moved = self.event_handler.handle_movement(player, world, self.frame_time)
             
             # Check for random encounters when moving (only in overworld)
-            if moved and self.encounter_handler and self.player.location == 'overworld':
+            if moved and self.encounter_handler and player.location == 'overworld':
                 try:
-                    current_time = pygame.time.get_ticks()
                     encounter = self.encounter_handler.check_for_encounter(
-                        self.player, self.world, current_time)
+                        player, world, self.frame_time)
                     
                     if encounter:
                         self.current_encounter = encounter
@@ -422,23 +530,17 @@ class Game:
                     pass
             
             # Check for treasure chest interaction
-            for chest in self.world.treasure_chests:
-                if (self.player.x, self.player.y) == chest['pos']:
-                    self.game_state = 'item_prompt'
-                    break
+            if (player.x, player.y) in world.treasure_chests:
+                self.game_state = 'item_prompt'
 
-        # Update UI Focus
-        if self.status_panel.state != 'CLOSED':
-            if self.status_panel.state == 'OPEN' and self.ui_focus != 'status':
-                self.ui_focus = 'status'
-        
-        if self.inventory_panel.state != 'CLOSED':
-            if self.inventory_panel.state == 'OPEN':
-                if self.ui_focus not in ['equipment', 'inventory']:
-                    self.ui_focus = 'inventory'
-        
+        # Update UI Focus; the toggle keys never leave both panels fully open
         if not is_panel_open:
             self.ui_focus = 'world'
+        elif self.inventory_panel.state == PanelState.OPEN:
+            if self.ui_focus not in ('equipment', 'inventory'):
+                self.ui_focus = 'inventory'
+        elif self.status_panel.state == PanelState.OPEN:
+            self.ui_focus = 'status'
 
     def draw(self):
         """Draw everything based on current state."""
@@ -467,28 +569,27 @@ class Game:
             draw_encounter_screen(self.screen, self.ui_font, self.current_encounter, 
                                  EncounterDisplay())
             
-            options = EncounterDisplay.get_encounter_options(self.current_encounter)
+            options = self.encounter_handler.get_encounter_options(self.current_encounter)
             draw_encounter_options(self.screen, self.ui_font, options, 
                                  self.encounter_handler.selected_option)
         except Exception as e:
             # Fallback to simple encounter display
             self.screen.fill(C_BACKGROUND)
-            text = "ENCOUNTER! Press ESC to flee."
-            text_surf = self.ui_font.render(text, True, C_TEXT)
+            text_surf = self.encounter_fallback_surf
             text_rect = text_surf.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
             self.screen.blit(text_surf, text_rect)
 
     def draw_combat(self):
         """Draw combat screen."""
         try:
-            alive_monsters = [m for m in self.current_encounter['monsters'] if m.is_alive]
+            alive_monsters = self.get_alive_monsters()
             draw_combat_screen(self.screen, self.ui_font, self.player, alive_monsters,
                              self.encounter_handler.combat_manager, 
                              self.encounter_handler.selected_action)
             
-            if self.combat_phase == 'player_turn':
+            if self.combat_phase == CombatPhase.PLAYER_TURN:
                 actions = self.encounter_handler.combat_manager.get_available_actions(
-                    self.player, alive_monsters, 'player_turn')
+                    self.player, alive_monsters, CombatPhase.PLAYER_TURN)
                 draw_combat_actions(self.screen, self.ui_font, actions,
                                   self.encounter_handler.selected_action)
             
@@ -496,80 +597,87 @@ class Game:
         except Exception as e:
             # Fallback to simple combat display
             self.screen.fill(C_BACKGROUND)
-            text = "COMBAT! Press ESC to attempt retreat."
-            text_surf = self.ui_font.render(text, True, C_TEXT)
+            text_surf = self.combat_fallback_surf
             text_rect = text_surf.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
             self.screen.blit(text_surf, text_rect)
 
     def draw_playing(self):
         """Draw the playing state with building system support."""
-        self.screen.fill(C_BACKGROUND)
+        # Bind the objects used throughout the frame once
+        screen = self.screen
+        player = self.player
+        camera = self.camera
+        world_surface = self.world_surface
+        tile_font = self.tile_font
+        ui_font = self.ui_font
+        game_state = self.game_state
+        status_panel = self.status_panel
+        inventory_panel = self.inventory_panel
         
         # Update camera
-        self.camera.update(self.player)
+        camera.update(player)
+        camera_x = camera.x
+        camera_y = camera.y
         
         # Draw world using new system (handles overworld/interior/dungeon automatically)
-        self.world_surface.fill(C_BACKGROUND)
-        self.world.draw(self.world_surface, self.tile_font, self.camera, self.player)
+        world_surface.fill(C_BACKGROUND)
+        self.world.draw(world_surface, tile_font, camera, player)
         
         # Draw player
-        player_screen_x = (self.player.x - self.camera.x) * TILE_SIZE
-        player_screen_y = (self.player.y - self.camera.y) * TILE_SIZE
+        player_screen_x = (player.x - camera_x) * TILE_SIZE
+        player_screen_y = (player.y - camera_y) * TILE_SIZE
         
-        player_render = self.player.get_render_info()
-        player_surface = self.tile_font.render(player_render['char'], True, player_render['color'])
-        self.world_surface.blit(player_surface, (player_screen_x, player_screen_y))
+        player_char, player_color = player.get_render_info()
+        player_surface = render_glyph(tile_font, player_char, player_color)
+        world_surface.blit(player_surface, (player_screen_x, player_screen_y))
         
         # Draw look cursor
-        if self.game_state == 'looking':
-            cursor_screen_x = (self.look_cursor_pos[0] - self.camera.x) * TILE_SIZE
-            cursor_screen_y = (self.look_cursor_pos[1] - self.camera.y) * TILE_SIZE
-            if (pygame.time.get_ticks() // 400) % 2 == 0:
-                cursor_surf = self.tile_font.render('X', True, C_CURSOR)
-                self.world_surface.blit(cursor_surf, (cursor_screen_x, cursor_screen_y))
+        if game_state == 'looking':
+            cursor_screen_x = (self.look_cursor_pos[0] - camera_x) * TILE_SIZE
+            cursor_screen_y = (self.look_cursor_pos[1] - camera_y) * TILE_SIZE
+            if self.cursor_blink_on:
+                cursor_surf = render_glyph(tile_font, 'X', C_CURSOR)
+                world_surface.blit(cursor_surf, (cursor_screen_x, cursor_screen_y))
 
-        self.screen.blit(self.world_surface, (0, 0))
+        # The world surface is screen-sized and opaque, so it replaces a screen fill
+        screen.blit(world_surface, (0, 0))
 
         # Update and draw panels
-        self.status_panel.update()
-        self.inventory_panel.update()
+        status_panel.update()
+        inventory_panel.update()
 
-        if self.status_panel.state != 'CLOSED':
-            draw_status_panel(self.status_panel.surface, self.player, self.ui_font)
-            self.status_panel.draw(self.screen)
+        if status_panel.state:
+            draw_status_panel(status_panel.surface, player, ui_font)
+            status_panel.draw(screen)
         
-        if self.inventory_panel.state != 'CLOSED':
-            draw_inventory_panel(self.inventory_panel.surface, self.player, 
-                               self.ui_font, self.ui_focus, self.ui_cursor)
-            self.inventory_panel.draw(self.screen)
+        if inventory_panel.state:
+            draw_inventory_panel(inventory_panel.surface, player, 
+                               ui_font, self.ui_focus, self.ui_cursor)
+            inventory_panel.draw(screen)
 
         # Draw prompts and dialogs
-        action_prompt_text = self.world.get_action_prompt(
-            self.player.x, self.player.y, self.player)
-        if self.game_state == 'item_prompt' and action_prompt_text:
-            draw_action_prompt(self.screen, action_prompt_text, self.ui_font)
-        elif self.game_state == 'looking':
-            look_desc = self.world.get_description(
-                self.look_cursor_pos[0], self.look_cursor_pos[1], self.player)
-            draw_action_prompt(self.screen, look_desc, self.ui_font)
+        action_prompt_text = self.get_action_prompt(player.x, player.y)
+        if game_state == 'item_prompt' and action_prompt_text:
+            draw_action_prompt(screen, action_prompt_text, ui_font)
+        elif game_state == 'looking':
+            look_desc = self.get_description(self.look_cursor_pos[0], self.look_cursor_pos[1])
+            draw_action_prompt(screen, look_desc, ui_font)
         elif action_prompt_text:  # Show building/dungeon prompts
-            draw_action_prompt(self.screen, action_prompt_text, self.ui_font)
+            draw_action_prompt(screen, action_prompt_text, ui_font)
         
         # Draw spell casting help
-        if self.game_state == 'playing':
-            help_text = "Spells: 1-Fireball 2-Magic Missile 3-Heal 4-Smoke | ENTER-Interact"
-            help_surf = self.ui_font.render(help_text, True, C_TEXT_DIM)
-            self.screen.blit(help_surf, (10, SCREEN_HEIGHT - 30))
-        
-        if self.game_state == 'equip_prompt':
-            if self.player.character.inventory:
-                item_name = self.player.character.inventory[self.ui_cursor].name
-                draw_confirmation_box(self.screen, f"Equip {item_name}? (Y/N)", self.ui_font)
-        elif self.game_state == 'unequip_prompt':
-            slot = list(self.player.character.equipped.keys())[self.ui_cursor]
-            if self.player.character.equipped[slot]:
-                item_name = self.player.character.equipped[slot].name
-                draw_confirmation_box(self.screen, f"Unequip {item_name}? (Y/N)", self.ui_font)
+        if game_state == 'playing':
+            screen.blit(self.help_surf, (10, SCREEN_HEIGHT - 30))
+        
+        if game_state == 'equip_prompt':
+            if player.character.inventory:
+                item_name = player.character.inventory[self.ui_cursor].name
+                draw_confirmation_box(screen, f"Equip {item_name}? (Y/N)", ui_font)
+        elif game_state == 'unequip_prompt':
+            item = player.character.equipped[EQUIPMENT_SLOTS[self.ui_cursor]]
+            if item:
+                item_name = item.name
+                draw_confirmation_box(screen, f"Unequip {item_name}? (Y/N)", ui_font)
 
     def start_character_creation(self):
         """Start the character creation process."""
@@ -596,6 +704,7 @@ class Game:
             self.ui_cursor = 0
             self.pending_action = None
             self.look_cursor_pos = [0, 0]
+            self.clear_tile_text_cache()
 
             self.state = 'playing'
             print("Game started successfully!")
@@ -615,12 +724,13 @@ class Game:
                 
                 # Restore treasure chests
                 if 'treasure_chests' in save_data['world_data']:
-                    self.world.treasure_chests = []
+                    self.world.treasure_chests = {}
                     for chest_data in save_data['world_data']['treasure_chests']:
-                        self.world.treasure_chests.append({
-                            'pos': tuple(chest_data['pos']),
+                        pos = tuple(chest_data['pos'])
+                        self.world.treasure_chests[pos] = {
+                            'pos': pos,
                             'item': SaveSystem._deserialize_item(chest_data['item'])
-                        })
+                        }
                 
                 # Set player
                 self.player = save_data['player']
@@ -636,6 +746,7 @@ class Game:
                 self.ui_cursor = 0
                 self.pending_action = None
                 self.look_cursor_pos = [0, 0]
+                self.clear_tile_text_cache()
 
                 self.state = 'playing'
             except Exception as e:
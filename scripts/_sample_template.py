@@ -0,0 +1,78 @@
+# scripts/_sample_template.py
+"""
+Sample monster workbook used by import_monsters.py --create-sample.
+"""
+import pandas as pd
+
+def create_sample_excel():
+    """Create a sample Excel file with the correct format."""
+    
+    # Sample monster data
+    monsters_data = [
+        {
+            'monster_id': 'kobold',
+            'name': 'Kobold',
+            'char': 'k',
+            'color_r': 113, 'color_g': 65, 'color_b': 59,
+            'ac': 7, 'hd': 0.5, 'hp_roll': '1d4+1', 'thac0': 19, 'movement': 60,
+            'morale': 6, 'alignment': 'Chaotic', 'xp_value': 5, 'encounter_size': '4d4',
+            'attack1_name': 'weapon', 'attack1_damage': '1d4-1', 'attack1_type': 'melee',
+            'attack2_name': '', 'attack2_damage': '', 'attack2_type': '',
+            'attack3_name': '', 'attack3_damage': '', 'attack3_type': '',
+            'save_death': 14, 'save_wands': 15, 'save_paralysis': 16, 'save_breath': 17, 'save_spells': 18,
+            'special_abilities': 'ambush,infravision_90,hate_gnomes'
+        },
+        {
+            'monster_id': 'goblin',
+            'name': 'Goblin',
+            'char': 'g',
+            'color_r': 139, 'color_g': 69, 'color_b': 19,
+            'ac': 6, 'hd': 1, 'hp_roll': '1d8', 'thac0': 19, 'movement': 60,
+            'morale': 7, 'alignment': 'Chaotic', 'xp_value': 10, 'encounter_size': '2d4',
+            'attack1_name': 'weapon', 'attack1_damage': '1d6', 'attack1_type': 'melee',
+            'attack2_name': '', 'attack2_damage': '', 'attack2_type': '',
+            'attack3_name': '', 'attack3_damage': '', 'attack3_type': '',
+            'save_death': 14, 'save_wands': 15, 'save_paralysis': 16, 'save_breath': 17, 'save_spells': 18,
+            'special_abilities': 'infravision_60'
+        }
+    ]
+    
+    # Sample encounter tables
+    encounter_data = [
+        {
+            'terrain': 'forest',
+            'roll_1': 'animal:forest_animal',
+            'roll_2': 'dragon:dragon_flyer_insect', 
+            'roll_3': 'flyer:dragon_flyer_insect',
+            'roll_4': 'human:forest_human',
+            'roll_5': 'humanoid:forest_humanoid',
+            'roll_6': 'insect:dragon_flyer_insect',
+            'roll_7': 'monster:forest_monster',
+            'roll_8': 'unusual:unusual'
+        }
+    ]
+    
+    # Sample subtables
+    subtable_data = [
+        {
+            'subtable_name': 'forest_humanoid',
+            'range_1_3': 'goblin',
+            'range_4_6': 'kobold',
+            'range_7_9': 'orc',
+            'range_10_12': 'elf',
+            'range_13_15': 'hobgoblin',
+            'range_16_18': 'gnoll',
+            'range_19_20': 'troll'
+        }
+    ]
+    
+    # Create Excel file
+    output_file = 'monster_template.xlsx'
+    
+    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+        pd.DataFrame(monsters_data).to_excel(writer, sheet_name='Monsters', index=False)
+        pd.DataFrame(encounter_data).to_excel(writer, sheet_name='Encounter Tables', index=False)
+        pd.DataFrame(subtable_data).to_excel(writer, sheet_name='Subtables', index=False)
+    
+    print(f"Created sample Excel template: {output_file}")
+    return output_file
\ No newline at end of file
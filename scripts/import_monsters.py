@@ -2,19 +2,66 @@
 """
 Script to import monster data from Excel spreadsheet to JSON format.
 """
-import pandas as pd
 import json
 import os
 import sys
 from pathlib import Path
+from openpyxl import load_workbook
 
-def import_monsters_from_excel(excel_file_path, output_json_path=None):
+# Columns read from each sheet; anything else in the workbook is skipped while parsing
+_ATTACK_FIELDS = tuple((f'attack{i}_name', f'attack{i}_damage', f'attack{i}_type')
+                       for i in range(1, 4))  # Up to 3 attacks
+_ATTACK_COLUMNS = tuple(column for fields in _ATTACK_FIELDS for column in fields)
+MONSTERS_USECOLS = frozenset((
+    'monster_id', 'name', 'char', 'color_r', 'color_g', 'color_b', 'ac', 'hd', 'hp_roll',
+    'thac0', 'movement', 'save_death', 'save_wands', 'save_paralysis', 'save_breath',
+    'save_spells', 'morale', 'alignment', 'xp_value', 'special_abilities', 'encounter_size'
+) + _ATTACK_COLUMNS)
+ENCOUNTER_USECOLS = frozenset(('terrain',) + tuple(f'roll_{i}' for i in range(1, 9)))
+
+# Fields every imported monster must have, in reporting order
+REQUIRED_MONSTER_FIELDS = ('name', 'char', 'color', 'ac', 'hd', 'hp_roll', 'attacks', 'thac0')
+_REQUIRED_MONSTER_FIELD_SET = frozenset(REQUIRED_MONSTER_FIELDS)
+
+def _is_subtable_column(column):
+    """Check whether a Subtables sheet column is used by the importer."""
+    return column == 'subtable_name' or str(column).startswith('range_')
+
+def _iter_sheet_rows(workbook, sheet_name, wanted_column):
+    """Yield each data row of a sheet as a dict keyed by the header row.
+    
+    Only columns accepted by wanted_column are kept, and blank cells come
+    through as None.
+    """
+    rows = workbook[sheet_name].iter_rows(values_only=True)
+    header = next(rows, ())
+    columns = [(index, name) for index, name in enumerate(header)
+               if name is not None and wanted_column(name)]
+    
+    for values in rows:
+        row = {}
+        for index, name in columns:
+            value = values[index] if index < len(values) else None
+            row[name] = None if value == '' else value
+        yield row
+
+def _cell_text(value):
+    """Get a cell value as stripped text, or None for a blank cell."""
+    if value is None:
+        return None
+    # Text cells already arrive as str; only numbers and dates need converting
+    if value.__class__ is not str:
+        value = str(value)
+    return value.strip()
+
+def import_monsters_from_excel(excel_file_path, output_json_path=None, pretty=False):
     """
     Import monster data from Excel file and convert to JSON format.
     
     Args:
         excel_file_path: Path to the Excel file
         output_json_path: Path for output JSON (optional)
+        pretty: Indent the JSON output for reading (optional)
     """
     
     if output_json_path is None:
@@ -26,8 +73,8 @@ def import_monsters_from_excel(excel_file_path, output_json_path=None):
     try:
         print(f"Reading Excel file: {excel_file_path}")
         
-        # Read the Excel file
-        excel_data = pd.ExcelFile(excel_file_path)
+        # Stream cell values only; styles and formulas are never materialised
+        workbook = load_workbook(excel_file_path, read_only=True, data_only=True)
         
         # Initialize the data structure
         monster_data = {
@@ -36,33 +83,41 @@ def import_monsters_from_excel(excel_file_path, output_json_path=None):
             "subtables": {}
         }
         
-        # Import monsters sheet
-        if 'Monsters' in excel_data.sheet_names:
-            print("Importing monsters...")
-            monsters_df = pd.read_excel(excel_file_path, sheet_name='Monsters')
-            monster_data["monsters"] = import_monsters_sheet(monsters_df)
-            print(f"Imported {len(monster_data['monsters'])} monsters")
-        
-        # Import encounter tables sheet
-        if 'Encounter Tables' in excel_data.sheet_names:
-            print("Importing encounter tables...")
-            encounter_df = pd.read_excel(excel_file_path, sheet_name='Encounter Tables')
-            monster_data["encounter_tables"] = import_encounter_tables_sheet(encounter_df)
-            print(f"Imported {len(monster_data['encounter_tables'])} encounter tables")
-        
-        # Import subtables sheet
-        if 'Subtables' in excel_data.sheet_names:
-            print("Importing subtables...")
-            subtables_df = pd.read_excel(excel_file_path, sheet_name='Subtables')
-            monster_data["subtables"] = import_subtables_sheet(subtables_df)
-            print(f"Imported {len(monster_data['subtables'])} subtables")
+        try:
+            # Import monsters sheet
+            if 'Monsters' in workbook.sheetnames:
+                print("Importing monsters...")
+                monster_rows = _iter_sheet_rows(workbook, 'Monsters', MONSTERS_USECOLS.__contains__)
+                monster_data["monsters"] = import_monsters_sheet(monster_rows)
+                print(f"Imported {len(monster_data['monsters'])} monsters")
+            
+            # Import encounter tables sheet
+            if 'Encounter Tables' in workbook.sheetnames:
+                print("Importing encounter tables...")
+                encounter_rows = _iter_sheet_rows(
+                    workbook, 'Encounter Tables', ENCOUNTER_USECOLS.__contains__)
+                monster_data["encounter_tables"] = import_encounter_tables_sheet(encounter_rows)
+                print(f"Imported {len(monster_data['encounter_tables'])} encounter tables")
+            
+            # Import subtables sheet
+            if 'Subtables' in workbook.sheetnames:
+                print("Importing subtables...")
+                subtable_rows = _iter_sheet_rows(workbook, 'Subtables', _is_subtable_column)
+                monster_data["subtables"] = import_subtables_sheet(subtable_rows)
+                print(f"Imported {len(monster_data['subtables'])} subtables")
+        finally:
+            # Read-only workbooks keep the file open until closed
+            workbook.close()
         
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_json_path), exist_ok=True)
         
-        # Write JSON file
-        with open(output_json_path, 'w', encoding='utf-8') as f:
-            json.dump(monster_data, f, indent=2, ensure_ascii=False)
+        # Write JSON file; compact output unless a readable file was asked for
+        with open(output_json_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            if pretty:
+                json.dump(monster_data, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(monster_data, f, ensure_ascii=False, separators=(',', ':'))
         
         print(f"Successfully exported to: {output_json_path}")
         
@@ -77,142 +132,166 @@ def import_monsters_from_excel(excel_file_path, output_json_path=None):
         traceback.print_exc()
         return False
 
-def import_monsters_sheet(df):
-    """Import the monsters sheet from DataFrame."""
+def _build_monster(row):
+    """Build a (monster_id, monster) pair from a monsters sheet row, or None for an empty row."""
+    # Skip empty rows; blank cells are read as None
+    if row.get('monster_id') is None:
+        return None
+    
+    monster_id = str(row['monster_id']).strip()
+    
+    # Build attacks list
+    attacks = []
+    for name_col, damage_col, type_col in _ATTACK_FIELDS:
+        attack_name = _cell_text(row.get(name_col))
+        if not attack_name:
+            continue
+        
+        attack_damage = _cell_text(row.get(damage_col))
+        attack_type = _cell_text(row.get(type_col))
+        attacks.append({
+            "name": attack_name,
+            "damage": attack_damage if attack_damage is not None else "1d6",
+            "type": attack_type if attack_type is not None else "melee"
+        })
+    
+    # Default attack if none specified
+    if not attacks:
+        attacks = [{"name": "weapon", "damage": "1d6", "type": "melee"}]
+    
+    # Parse special abilities
+    special_abilities = []
+    abilities_str = _cell_text(row.get('special_abilities'))
+    if abilities_str:
+        special_abilities = [s.strip() for s in abilities_str.split(',')]
+    
+    # Build monster data
+    monster = {
+        "name": str(row['name']).strip(),
+        "char": str(row['char']).strip(),
+        "color": [
+            int(row.get('color_r', 100)),
+            int(row.get('color_g', 100)), 
+            int(row.get('color_b', 100))
+        ],
+        "ac": int(row.get('ac', 10)),
+        "hd": float(row.get('hd', 1)),
+        "hp_roll": str(row.get('hp_roll', '1d8')).strip(),
+        "attacks": attacks,
+        "thac0": int(row.get('thac0', 19)),
+        "movement": int(row.get('movement', 120)),
+        "saves": {
+            "death": int(row.get('save_death', 14)),
+            "wands": int(row.get('save_wands', 15)),
+            "paralysis": int(row.get('save_paralysis', 16)),
+            "breath": int(row.get('save_breath', 17)),
+            "spells": int(row.get('save_spells', 18))
+        },
+        "morale": int(row.get('morale', 8)),
+        "alignment": str(row.get('alignment', 'Neutral')).strip(),
+        "xp_value": int(row.get('xp_value', 10)),
+        "special_abilities": special_abilities,
+        "encounter_size": str(row.get('encounter_size', '1')).strip()
+    }
+    
+    return monster_id, monster
+
+def import_monsters_sheet(rows):
+    """Import the monsters sheet from an iterable of dict rows."""
     monsters = {}
     
-    for _, row in df.iterrows():
+    for row in rows:
         try:
-            # Skip empty rows
-            if pd.isna(row.get('monster_id')):
-                continue
-            
-            monster_id = str(row['monster_id']).strip()
-            
-            # Build attacks list
-            attacks = []
-            for i in range(1, 4):  # Up to 3 attacks
-                attack_name = row.get(f'attack{i}_name')
-                attack_damage = row.get(f'attack{i}_damage') 
-                attack_type = row.get(f'attack{i}_type')
-                
-                if pd.notna(attack_name) and attack_name.strip():
-                    attacks.append({
-                        "name": str(attack_name).strip(),
-                        "damage": str(attack_damage).strip() if pd.notna(attack_damage) else "1d6",
-                        "type": str(attack_type).strip() if pd.notna(attack_type) else "melee"
-                    })
-            
-            # Default attack if none specified
-            if not attacks:
-                attacks = [{"name": "weapon", "damage": "1d6", "type": "melee"}]
-            
-            # Parse special abilities
-            special_abilities = []
-            abilities_str = row.get('special_abilities')
-            if pd.notna(abilities_str) and str(abilities_str).strip():
-                special_abilities = [s.strip() for s in str(abilities_str).split(',')]
-            
-            # Build monster data
-            monster = {
-                "name": str(row['name']).strip(),
-                "char": str(row['char']).strip(),
-                "color": [
-                    int(row.get('color_r', 100)),
-                    int(row.get('color_g', 100)), 
-                    int(row.get('color_b', 100))
-                ],
-                "ac": int(row.get('ac', 10)),
-                "hd": float(row.get('hd', 1)),
-                "hp_roll": str(row.get('hp_roll', '1d8')).strip(),
-                "attacks": attacks,
-                "thac0": int(row.get('thac0', 19)),
-                "movement": int(row.get('movement', 120)),
-                "saves": {
-                    "death": int(row.get('save_death', 14)),
-                    "wands": int(row.get('save_wands', 15)),
-                    "paralysis": int(row.get('save_paralysis', 16)),
-                    "breath": int(row.get('save_breath', 17)),
-                    "spells": int(row.get('save_spells', 18))
-                },
-                "morale": int(row.get('morale', 8)),
-                "alignment": str(row.get('alignment', 'Neutral')).strip(),
-                "xp_value": int(row.get('xp_value', 10)),
-                "special_abilities": special_abilities,
-                "encounter_size": str(row.get('encounter_size', '1')).strip()
-            }
-            
-            monsters[monster_id] = monster
-            
+            built = _build_monster(row)
         except Exception as e:
             print(f"Error processing monster row {row.get('monster_id', 'unknown')}: {e}")
             continue
+        
+        if built:
+            monster_id, monster = built
+            monsters[monster_id] = monster
     
     return monsters
 
-def import_encounter_tables_sheet(df):
-    """Import the encounter tables sheet from DataFrame."""
+def _build_encounter_table(row):
+    """Build a (terrain, table) pair from an encounter tables row, or None if it has no entries."""
+    terrain = _cell_text(row['terrain'])
+    if not terrain:
+        return None
+    
+    table = {}
+    for i in range(1, 9):  # d8 rolls
+        entry_str = _cell_text(row.get(f'roll_{i}'))
+        if entry_str is None:
+            continue
+        
+        if ':' in entry_str:
+            # Format: "category:subtable" or "direct:monster_id"
+            category, target = entry_str.split(':', 1)
+            if category == 'direct':
+                table[str(i)] = {"result": target}
+            else:
+                table[str(i)] = {"category": category, "subtable": target}
+        else:
+            # Direct monster reference
+            table[str(i)] = {"result": entry_str}
+    
+    return (terrain, table) if table else None
+
+def import_encounter_tables_sheet(rows):
+    """Import the encounter tables sheet from an iterable of dict rows."""
     encounter_tables = {}
     
-    for _, row in df.iterrows():
+    for row in rows:
         try:
-            terrain = str(row['terrain']).strip()
-            if pd.isna(terrain):
-                continue
-            
-            table = {}
-            for i in range(1, 9):  # d8 rolls
-                roll_col = f'roll_{i}'
-                if roll_col in row and pd.notna(row[roll_col]):
-                    entry_str = str(row[roll_col]).strip()
-                    
-                    if ':' in entry_str:
-                        # Format: "category:subtable" or "direct:monster_id"
-                        category, target = entry_str.split(':', 1)
-                        if category == 'direct':
-                            table[str(i)] = {"result": target}
-                        else:
-                            table[str(i)] = {"category": category, "subtable": target}
-                    else:
-                        # Direct monster reference
-                        table[str(i)] = {"result": entry_str}
-            
-            if table:
-                encounter_tables[terrain] = table
-                
+            built = _build_encounter_table(row)
         except Exception as e:
             print(f"Error processing encounter table row {row.get('terrain', 'unknown')}: {e}")
             continue
+        
+        if built:
+            terrain, table = built
+            encounter_tables[terrain] = table
     
     return encounter_tables
 
-def import_subtables_sheet(df):
-    """Import the subtables sheet from DataFrame."""
+def _build_subtable(row, range_columns):
+    """Build a (subtable_name, subtable) pair from a subtables row, or None if it has no entries."""
+    subtable_name = _cell_text(row['subtable_name'])
+    if not subtable_name:
+        return None
+    
+    subtable = {}
+    
+    # Process range columns
+    for col, range_part in range_columns:
+        monster_id = _cell_text(row[col])
+        if monster_id:
+            subtable[range_part] = monster_id
+    
+    return (subtable_name, subtable) if subtable else None
+
+def import_subtables_sheet(rows):
+    """Import the subtables sheet from an iterable of dict rows."""
     subtables = {}
+    range_columns = None
     
-    for _, row in df.iterrows():
+    for row in rows:
+        # Every row shares the header, so parse the range columns once
+        # (e.g., 'range_1_3' -> '1-3')
+        if range_columns is None:
+            range_columns = [(col, col[len('range_'):].replace('_', '-'))
+                             for col in row if str(col).startswith('range_')]
+        
         try:
-            subtable_name = str(row['subtable_name']).strip()
-            if pd.isna(subtable_name):
-                continue
-            
-            subtable = {}
-            
-            # Process range columns
-            for col in df.columns:
-                if col.startswith('range_'):
-                    if pd.notna(row[col]) and str(row[col]).strip():
-                        # Extract range from column name (e.g., 'range_1_3' -> '1-3')
-                        range_part = col.replace('range_', '').replace('_', '-')
-                        monster_id = str(row[col]).strip()
-                        subtable[range_part] = monster_id
-            
-            if subtable:
-                subtables[subtable_name] = subtable
-                
+            built = _build_subtable(row, range_columns)
         except Exception as e:
             print(f"Error processing subtable row {row.get('subtable_name', 'unknown')}: {e}")
             continue
+        
+        if built:
+            subtable_name, subtable = built
+            subtables[subtable_name] = subtable
     
     return subtables
 
@@ -221,11 +300,15 @@ def validate_monster_data(data):
     print("\nValidating imported data...")
     
     errors = []
+    monsters = data["monsters"]
+    subtables = data["subtables"]
     
     # Check for required fields in monsters
-    for monster_id, monster in data["monsters"].items():
-        required_fields = ['name', 'char', 'color', 'ac', 'hd', 'hp_roll', 'attacks', 'thac0']
-        for field in required_fields:
+    for monster_id, monster in monsters.items():
+        # Complete monsters pass with a single subset test
+        if _REQUIRED_MONSTER_FIELD_SET <= monster.keys():
+            continue
+        for field in REQUIRED_MONSTER_FIELDS:
             if field not in monster:
                 errors.append(f"Monster {monster_id} missing required field: {field}")
     
@@ -234,17 +317,17 @@ def validate_monster_data(data):
         for roll, entry in table.items():
             if 'subtable' in entry:
                 subtable_name = entry['subtable']
-                if subtable_name not in data["subtables"]:
+                if subtable_name not in subtables:
                     errors.append(f"Encounter table {terrain} references missing subtable: {subtable_name}")
             elif 'result' in entry:
                 monster_id = entry['result']
-                if monster_id not in data["monsters"]:
+                if monster_id not in monsters:
                     errors.append(f"Encounter table {terrain} references missing monster: {monster_id}")
     
     # Check subtable references
-    for subtable_name, subtable in data["subtables"].items():
+    for subtable_name, subtable in subtables.items():
         for range_key, monster_id in subtable.items():
-            if monster_id not in data["monsters"]:
+            if monster_id not in monsters:
                 errors.append(f"Subtable {subtable_name} references missing monster: {monster_id}")
     
     if errors:
@@ -254,98 +337,30 @@ def validate_monster_data(data):
     else:
         print("✓ All validation checks passed!")
 
-def create_sample_excel():
-    """Create a sample Excel file with the correct format."""
-    
-    # Sample monster data
-    monsters_data = [
-        {
-            'monster_id': 'kobold',
-            'name': 'Kobold',
-            'char': 'k',
-            'color_r': 113, 'color_g': 65, 'color_b': 59,
-            'ac': 7, 'hd': 0.5, 'hp_roll': '1d4+1', 'thac0': 19, 'movement': 60,
-            'morale': 6, 'alignment': 'Chaotic', 'xp_value': 5, 'encounter_size': '4d4',
-            'attack1_name': 'weapon', 'attack1_damage': '1d4-1', 'attack1_type': 'melee',
-            'attack2_name': '', 'attack2_damage': '', 'attack2_type': '',
-            'attack3_name': '', 'attack3_damage': '', 'attack3_type': '',
-            'save_death': 14, 'save_wands': 15, 'save_paralysis': 16, 'save_breath': 17, 'save_spells': 18,
-            'special_abilities': 'ambush,infravision_90,hate_gnomes'
-        },
-        {
-            'monster_id': 'goblin',
-            'name': 'Goblin',
-            'char': 'g',
-            'color_r': 139, 'color_g': 69, 'color_b': 19,
-            'ac': 6, 'hd': 1, 'hp_roll': '1d8', 'thac0': 19, 'movement': 60,
-            'morale': 7, 'alignment': 'Chaotic', 'xp_value': 10, 'encounter_size': '2d4',
-            'attack1_name': 'weapon', 'attack1_damage': '1d6', 'attack1_type': 'melee',
-            'attack2_name': '', 'attack2_damage': '', 'attack2_type': '',
-            'attack3_name': '', 'attack3_damage': '', 'attack3_type': '',
-            'save_death': 14, 'save_wands': 15, 'save_paralysis': 16, 'save_breath': 17, 'save_spells': 18,
-            'special_abilities': 'infravision_60'
-        }
-    ]
-    
-    # Sample encounter tables
-    encounter_data = [
-        {
-            'terrain': 'forest',
-            'roll_1': 'animal:forest_animal',
-            'roll_2': 'dragon:dragon_flyer_insect', 
-            'roll_3': 'flyer:dragon_flyer_insect',
-            'roll_4': 'human:forest_human',
-            'roll_5': 'humanoid:forest_humanoid',
-            'roll_6': 'insect:dragon_flyer_insect',
-            'roll_7': 'monster:forest_monster',
-            'roll_8': 'unusual:unusual'
-        }
-    ]
-    
-    # Sample subtables
-    subtable_data = [
-        {
-            'subtable_name': 'forest_humanoid',
-            'range_1_3': 'goblin',
-            'range_4_6': 'kobold',
-            'range_7_9': 'orc',
-            'range_10_12': 'elf',
-            'range_13_15': 'hobgoblin',
-            'range_16_18': 'gnoll',
-            'range_19_20': 'troll'
-        }
-    ]
-    
-    # Create Excel file
-    output_file = 'monster_template.xlsx'
-    
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-        pd.DataFrame(monsters_data).to_excel(writer, sheet_name='Monsters', index=False)
-        pd.DataFrame(encounter_data).to_excel(writer, sheet_name='Encounter Tables', index=False)
-        pd.DataFrame(subtable_data).to_excel(writer, sheet_name='Subtables', index=False)
-    
-    print(f"Created sample Excel template: {output_file}")
-    return output_file
-
 def main():
     """Main function for command line usage."""
-    if len(sys.argv) < 2:
-        print("Usage: python import_monsters.py <excel_file> [output_json]")
+    args = [arg for arg in sys.argv[1:] if arg != '--pretty']
+    pretty = len(args) < len(sys.argv) - 1
+    
+    if not args:
+        print("Usage: python import_monsters.py <excel_file> [output_json] [--pretty]")
         print("   or: python import_monsters.py --create-sample")
         return
     
-    if sys.argv[1] == '--create-sample':
+    if args[0] == '--create-sample':
+        # The template data (and pandas, used to write it) is only needed here
+        from _sample_template import create_sample_excel
         create_sample_excel()
         return
     
-    excel_file = sys.argv[1]
-    output_json = sys.argv[2] if len(sys.argv) > 2 else None
+    excel_file = args[0]
+    output_json = args[1] if len(args) > 1 else None
     
     if not os.path.exists(excel_file):
         print(f"Error: Excel file not found: {excel_file}")
         return
     
-    success = import_monsters_from_excel(excel_file, output_json)
+    success = import_monsters_from_excel(excel_file, output_json, pretty)
     if success:
         print("Import completed successfully!")
     else:
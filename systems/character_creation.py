@@ -3,10 +3,45 @@
 Character creation system for the ASCII RPG game.
 """
 import pygame
-import random
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 from ui.colors import *
 from entities.character import Character
+from ui.ascii_definitions import render_glyph
+from systems.dice import choices
+
+AVAILABLE_CLASSES = (
+    "Fighter", "Cleric", "Magic-User", "Thief", 
+    "Ranger", "Paladin", "Druid"
+)
+
+CLASS_DESCRIPTIONS = {
+    "Fighter": "Masters of combat and weapons. High HP and THAC0.",
+    "Cleric": "Divine spellcasters and healers. Moderate combat ability.",
+    "Magic-User": "Arcane spellcasters with powerful magic but weak in combat.",
+    "Thief": "Stealthy rogues with special abilities. Moderate combat.",
+    "Ranger": "Wilderness warriors with tracking and nature skills.",
+    "Paladin": "Holy warriors combining combat with divine magic.",
+    "Druid": "Nature priests with animal and elemental magic."
+}
+
+# Class-specific bonuses and requirements
+CLASS_BONUSES = {
+    "Fighter": {"hp_bonus": 2, "thac0_bonus": -1, "primary": "str", "min_primary": 9},
+    "Cleric": {"hp_bonus": 0, "thac0_bonus": 0, "primary": "wis", "min_primary": 9},
+    "Magic-User": {"hp_bonus": -2, "thac0_bonus": 1, "primary": "int", "min_primary": 9},
+    "Thief": {"hp_bonus": -1, "thac0_bonus": 0, "primary": "dex", "min_primary": 9},
+    "Ranger": {"hp_bonus": 1, "thac0_bonus": -1, "primary": "str", "min_primary": 13, "secondary": "dex", "min_secondary": 13},
+    "Paladin": {"hp_bonus": 1, "thac0_bonus": -1, "primary": "str", "min_primary": 12, "secondary": "cha", "min_secondary": 17},
+    "Druid": {"hp_bonus": 0, "thac0_bonus": 0, "primary": "wis", "min_primary": 12, "secondary": "cha", "min_secondary": 15}
+}
+_DEFAULT_BONUS = {"hp_bonus": 0, "thac0_bonus": 0, "primary": "str", "min_primary": 3}
+
+# Ability scores in generation order and die faces for 3d6 rolls
+_ABILITY_NAMES = ('str', 'dex', 'con', 'int', 'wis', 'cha')
+_D6_FACES = (1, 2, 3, 4, 5, 6)
+
+# Ability score modifiers indexed by score (0-18)
+_STAT_MOD = (-3, -3, -3, -3, -2, -2, -1, -1, -1, 0, 0, 0, 0, 1, 1, 1, 2, 2, 3)
 
 class CharacterCreation:
     """Character creation screen and logic."""
@@ -17,62 +52,52 @@ class CharacterCreation:
         self.character_name = ""
         self.character_class = "Fighter"
         self.ability_scores = {}
-        self.available_classes = [
-            "Fighter", "Cleric", "Magic-User", "Thief", 
-            "Ranger", "Paladin", "Druid"
-        ]
-        self.class_descriptions = {
-            "Fighter": "Masters of combat and weapons. High HP and THAC0.",
-            "Cleric": "Divine spellcasters and healers. Moderate combat ability.",
-            "Magic-User": "Arcane spellcasters with powerful magic but weak in combat.",
-            "Thief": "Stealthy rogues with special abilities. Moderate combat.",
-            "Ranger": "Wilderness warriors with tracking and nature skills.",
-            "Paladin": "Holy warriors combining combat with divine magic.",
-            "Druid": "Nature priests with animal and elemental magic."
-        }
+        self.available_classes = AVAILABLE_CLASSES
+        self.class_descriptions = CLASS_DESCRIPTIONS
         self.selected_class_index = 0
         self.input_active = True
         self.reroll_count = 0
         self.max_rerolls = 3
+        self._text_cache = {}  # (text, color) -> rendered surface
+        self._last_drawn_state = None
+        self._eligibility_cache = None  # per-class _can_be_class results for the current scores
         self._generate_stats()
 
     def _generate_stats(self):
         """Generate random ability scores using 3d6."""
+        # Roll all 18 dice in one call and sum them in groups of three
+        dice = choices(_D6_FACES, k=3 * len(_ABILITY_NAMES))
         self.ability_scores = {
-            'str': self._roll_stat(),
-            'dex': self._roll_stat(),
-            'con': self._roll_stat(),
-            'int': self._roll_stat(),
-            'wis': self._roll_stat(),
-            'cha': self._roll_stat()
+            name: dice[i] + dice[i + 1] + dice[i + 2]
+            for name, i in zip(_ABILITY_NAMES, range(0, len(dice), 3))
         }
+        self._eligibility_cache = None
+        
+        # Score lines only change on a reroll, so format them here instead of every frame
+        self._stat_lines = []
+        self._summary_stat_lines = []
+        for score_name, value in self.ability_scores.items():
+            modifier = self._get_stat_modifier(value)
+            mod_str = f"({'+' if modifier >= 0 else ''}{modifier})"
+            self._stat_lines.append(f"{score_name.upper()}: {value:2d} {mod_str}")
+            self._summary_stat_lines.append(f"  {score_name.upper()}: {value} {mod_str}")
+        self._update_class_lines()
 
-    def _roll_stat(self):
-        """Roll 3d6 for an ability score."""
-        return sum(random.randint(1, 6) for _ in range(3))
+    def _update_class_lines(self):
+        """Format the starting HP and THAC0 lines for the current class and scores."""
+        bonuses = self._get_class_bonuses(self.character_class)
+        hp = max(1, 8 + bonuses["hp_bonus"] + self._get_stat_modifier(self.ability_scores['con']))
+        thac0 = 20 + bonuses["thac0_bonus"]
+        self._hp_line = f"Starting HP: {hp}"
+        self._thac0_line = f"THAC0: {thac0}"
 
     def _get_stat_modifier(self, score):
         """Calculate ability score modifier."""
-        if score <= 3: return -3
-        if score <= 5: return -2
-        if score <= 8: return -1
-        if score <= 12: return 0
-        if score <= 15: return 1
-        if score <= 17: return 2
-        return 3
+        return _STAT_MOD[min(18, max(0, score))]
 
     def _get_class_bonuses(self, char_class):
         """Get class-specific bonuses and requirements."""
-        bonuses = {
-            "Fighter": {"hp_bonus": 2, "thac0_bonus": -1, "primary": "str", "min_primary": 9},
-            "Cleric": {"hp_bonus": 0, "thac0_bonus": 0, "primary": "wis", "min_primary": 9},
-            "Magic-User": {"hp_bonus": -2, "thac0_bonus": 1, "primary": "int", "min_primary": 9},
-            "Thief": {"hp_bonus": -1, "thac0_bonus": 0, "primary": "dex", "min_primary": 9},
-            "Ranger": {"hp_bonus": 1, "thac0_bonus": -1, "primary": "str", "min_primary": 13, "secondary": "dex", "min_secondary": 13},
-            "Paladin": {"hp_bonus": 1, "thac0_bonus": -1, "primary": "str", "min_primary": 12, "secondary": "cha", "min_secondary": 17},
-            "Druid": {"hp_bonus": 0, "thac0_bonus": 0, "primary": "wis", "min_primary": 12, "secondary": "cha", "min_secondary": 15}
-        }
-        return bonuses.get(char_class, {"hp_bonus": 0, "thac0_bonus": 0, "primary": "str", "min_primary": 3})
+        return CLASS_BONUSES.get(char_class, _DEFAULT_BONUS)
 
     def _can_be_class(self, char_class):
         """Check if current stats meet class requirements."""
@@ -121,6 +146,7 @@ class CharacterCreation:
             selected_class = self.available_classes[self.selected_class_index]
             if self._can_be_class(selected_class):
                 self.character_class = selected_class
+                self._update_class_lines()
                 self.step = 'stats'
             # If can't be class, stay here (could add error message)
         elif event.key == pygame.K_ESCAPE:
@@ -171,18 +197,35 @@ class CharacterCreation:
             self.step = 'stats'
             return None
 
+    def _text(self, text, color):
+        """Get a rendered text surface, rendering each (text, color) pair only once."""
+        key = (text, tuple(color))
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = self._text_cache[key] = self.font.render(text, True, color)
+        return surf
+
     def draw(self, screen):
         """Draw the character creation screen."""
+        # The screen only changes on input (and cursor blinks on the name step),
+        # so skip repainting while the drawn state is unchanged
+        show_cursor = self.step == 'name' and pygame.time.get_ticks() % 1000 < 500
+        drawn_state = (self.step, self.character_name, self.selected_class_index,
+                       tuple(self.ability_scores.values()), self.reroll_count, show_cursor)
+        if drawn_state == self._last_drawn_state:
+            return
+        self._last_drawn_state = drawn_state
+        
         screen.fill(C_BACKGROUND)
         
         # Draw title
         title = "Character Creation"
-        title_surf = self.font.render(title, True, C_GOLD)
+        title_surf = self._text(title, C_GOLD)
         title_rect = title_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=30)
         screen.blit(title_surf, title_rect)
         
         if self.step == 'name':
-            self._draw_name_step(screen)
+            self._draw_name_step(screen, show_cursor)
         elif self.step == 'class':
             self._draw_class_step(screen)
         elif self.step == 'stats':
@@ -190,26 +233,36 @@ class CharacterCreation:
         elif self.step == 'confirm':
             self._draw_confirm_step(screen)
 
-    def _draw_name_step(self, screen):
+    def _draw_name_step(self, screen, show_cursor):
         """Draw the name input step."""
         y = 120
         
         prompt = "Enter your character's name:"
-        prompt_surf = self.font.render(prompt, True, C_TEXT)
+        prompt_surf = self._text(prompt, C_TEXT)
         prompt_rect = prompt_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
         screen.blit(prompt_surf, prompt_rect)
         
         # Name input box
         y += 60
-        name_display = self.character_name + ("_" if pygame.time.get_ticks() % 1000 < 500 else "")
-        name_surf = self.font.render(name_display, True, C_CURSOR)
-        name_rect = name_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
+        # The name changes with every keystroke, so it is drawn from cached
+        # per-character glyphs (the font is monospaced) rather than re-rendered
+        glyphs = [render_glyph(self.font, char, C_CURSOR) for char in self.character_name]
+        if show_cursor:
+            glyphs.append(render_glyph(self.font, "_", C_CURSOR))
+        name_rect = pygame.Rect(0, y, sum(glyph.get_width() for glyph in glyphs), self.font.get_height())
+        name_rect.centerx = SCREEN_WIDTH // 2
         
         # Draw input box
         box_rect = name_rect.inflate(40, 20)
         pygame.draw.rect(screen, C_PANEL_BG, box_rect)
         pygame.draw.rect(screen, C_BORDER, box_rect, 2)
-        screen.blit(name_surf, name_rect)
+        
+        glyph_x = name_rect.x
+        blit_seq = []
+        for glyph in glyphs:
+            blit_seq.append((glyph, (glyph_x, y)))
+            glyph_x += glyph.get_width()
+        screen.blits(blit_seq, doreturn=False)
         
         # Instructions
         y += 80
@@ -218,7 +271,7 @@ class CharacterCreation:
             "ESC - Return to main menu"
         ]
         for instruction in instructions:
-            inst_surf = self.font.render(instruction, True, C_TEXT_DIM)
+            inst_surf = self._text(instruction, C_TEXT_DIM)
             inst_rect = inst_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
             screen.blit(inst_surf, inst_rect)
             y += 30
@@ -228,16 +281,20 @@ class CharacterCreation:
         y = 100
         
         prompt = f"Choose a class for {self.character_name}:"
-        prompt_surf = self.font.render(prompt, True, C_TEXT)
+        prompt_surf = self._text(prompt, C_TEXT)
         prompt_rect = prompt_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
         screen.blit(prompt_surf, prompt_rect)
         
         y += 60
         
+        # Class eligibility only changes with the scores, so check it once per roll
+        eligibility = self._eligibility_cache
+        if eligibility is None:
+            eligibility = self._eligibility_cache = [self._can_be_class(c) for c in self.available_classes]
+        
         # Draw class list
-        for i, char_class in enumerate(self.available_classes):
+        for i, (char_class, can_be) in enumerate(zip(self.available_classes, eligibility)):
             color = C_CURSOR if i == self.selected_class_index else C_TEXT
-            can_be = self._can_be_class(char_class)
             
             if not can_be:
                 color = C_TEXT_DIM
@@ -246,7 +303,7 @@ class CharacterCreation:
             suffix = " (Requirements not met)" if not can_be else ""
             class_text = f"{prefix}{char_class}{suffix}"
             
-            class_surf = self.font.render(class_text, True, color)
+            class_surf = self._text(class_text, color)
             class_rect = class_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
             screen.blit(class_surf, class_rect)
             y += 30
@@ -255,7 +312,7 @@ class CharacterCreation:
         y += 20
         selected_class = self.available_classes[self.selected_class_index]
         desc = self.class_descriptions[selected_class]
-        desc_surf = self.font.render(desc, True, C_TEXT_DIM)
+        desc_surf = self._text(desc, C_TEXT_DIM)
         desc_rect = desc_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
         screen.blit(desc_surf, desc_rect)
         
@@ -267,7 +324,7 @@ class CharacterCreation:
             "ESC - Back to name"
         ]
         for instruction in instructions:
-            inst_surf = self.font.render(instruction, True, C_TEXT_DIM)
+            inst_surf = self._text(instruction, C_TEXT_DIM)
             inst_rect = inst_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
             screen.blit(inst_surf, inst_rect)
             y += 25
@@ -277,35 +334,27 @@ class CharacterCreation:
         y = 100
         
         prompt = f"Ability Scores for {self.character_name} the {self.character_class}:"
-        prompt_surf = self.font.render(prompt, True, C_TEXT)
+        prompt_surf = self._text(prompt, C_TEXT)
         prompt_rect = prompt_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
         screen.blit(prompt_surf, prompt_rect)
         
         y += 60
         
         # Draw ability scores
-        for score_name, value in self.ability_scores.items():
-            modifier = self._get_stat_modifier(value)
-            mod_str = f"({'+' if modifier >= 0 else ''}{modifier})"
-            score_text = f"{score_name.upper()}: {value:2d} {mod_str}"
-            
-            score_surf = self.font.render(score_text, True, C_TEXT)
+        for score_text in self._stat_lines:
+            score_surf = self._text(score_text, C_TEXT)
             score_rect = score_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
             screen.blit(score_surf, score_rect)
             y += 30
         
         # Show calculated HP and THAC0
         y += 20
-        bonuses = self._get_class_bonuses(self.character_class)
-        hp = max(1, 8 + bonuses["hp_bonus"] + self._get_stat_modifier(self.ability_scores['con']))
-        thac0 = 20 + bonuses["thac0_bonus"]
-        
-        hp_surf = self.font.render(f"Starting HP: {hp}", True, C_GOLD)
+        hp_surf = self._text(self._hp_line, C_GOLD)
         hp_rect = hp_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
         screen.blit(hp_surf, hp_rect)
         
         y += 30
-        thac0_surf = self.font.render(f"THAC0: {thac0}", True, C_GOLD)
+        thac0_surf = self._text(self._thac0_line, C_GOLD)
         thac0_rect = thac0_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
         screen.blit(thac0_surf, thac0_rect)
         
@@ -320,7 +369,7 @@ class CharacterCreation:
         
         for i, instruction in enumerate(instructions):
             color = C_TEXT_DIM if i == 1 and rerolls_left == 0 else C_TEXT_DIM
-            inst_surf = self.font.render(instruction, True, color)
+            inst_surf = self._text(instruction, color)
             inst_rect = inst_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
             screen.blit(inst_surf, inst_rect)
             y += 25
@@ -330,7 +379,7 @@ class CharacterCreation:
         y = 120
         
         prompt = "Create this character?"
-        prompt_surf = self.font.render(prompt, True, C_TEXT)
+        prompt_surf = self._text(prompt, C_TEXT)
         prompt_rect = prompt_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
         screen.blit(prompt_surf, prompt_rect)
         
@@ -347,18 +396,14 @@ class CharacterCreation:
         for line in summary:
             if line:
                 color = C_GOLD if line.startswith(("Name:", "Class:")) else C_TEXT
-                line_surf = self.font.render(line, True, color)
+                line_surf = self._text(line, color)
                 line_rect = line_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
                 screen.blit(line_surf, line_rect)
             y += 25
         
         # Ability scores summary
-        for score_name, value in self.ability_scores.items():
-            modifier = self._get_stat_modifier(value)
-            mod_str = f"({'+' if modifier >= 0 else ''}{modifier})"
-            score_text = f"  {score_name.upper()}: {value} {mod_str}"
-            
-            score_surf = self.font.render(score_text, True, C_TEXT_DIM)
+        for score_text in self._summary_stat_lines:
+            score_surf = self._text(score_text, C_TEXT_DIM)
             score_rect = score_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
             screen.blit(score_surf, score_rect)
             y += 25
@@ -366,6 +411,6 @@ class CharacterCreation:
         # Final prompt
         y += 40
         confirm_text = "Y - Yes, create character    N - No, go back"
-        confirm_surf = self.font.render(confirm_text, True, C_CURSOR)
+        confirm_surf = self._text(confirm_text, C_CURSOR)
         confirm_rect = confirm_surf.get_rect(centerx=SCREEN_WIDTH // 2, y=y)
         screen.blit(confirm_surf, confirm_rect)
\ No newline at end of file
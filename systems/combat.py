@@ -2,10 +2,59 @@
 """
 Combat system for the ASCII RPG game based on Old-School Essentials rules.
 """
-import random
+import enum
+from collections import deque
+from systems.dice import randrange, choices
+
+class CombatPhase(enum.IntEnum):
+    """Phases of a combat round."""
+    DECLARE_SPELLS = 0
+    PLAYER_TURN = 1
+    MONSTER_TURN = 2
+
+# Action menus for each phase, built once and shared by every call
+_DECLARE_ACTIONS = ('Declare Spell', 'No Spell', 'Retreat')
+_MELEE_ACTIONS = ('Melee Attack', 'Fighting Withdrawal')
+_RANGED_ACTIONS = ('Move', 'Missile Attack')
+_SPELL_ACTIONS = ('Cast Declared Spell',)
+_COMMON_ACTIONS = ('Wait', 'Retreat')
+_PLAYER_ACTIONS = {
+    (True, False): _MELEE_ACTIONS + _COMMON_ACTIONS,
+    (True, True): _MELEE_ACTIONS + _SPELL_ACTIONS + _COMMON_ACTIONS,
+    (False, False): _RANGED_ACTIONS + _COMMON_ACTIONS,
+    (False, True): _RANGED_ACTIONS + _SPELL_ACTIONS + _COMMON_ACTIONS,
+}
+_MONSTER_ACTIONS = ('Monsters Act',)  # Automatic
+
+# Combat log entries kept; older lines drop off the front
+COMBAT_LOG_LENGTH = 200
+
+# Combat log entries are stored as (event, *args) tuples and only formatted
+# into text when displayed; fixed messages are stored as plain strings
+_LOG_FORMATS = {
+    'round': "--- Round {} ---",
+    'initiative': "Initiative: Player {}, Monsters {}",
+    'hit': "{} hits {} for {} damage!",
+    'slain': "{} is slain!",
+    'miss': "{} attacks {} but misses!",
+    'flee': "{} flees in terror!",
+    'xp': "You gain {} experience points!",
+}
+
+def format_combat_event(entry):
+    """Format a combat log entry as display text."""
+    if isinstance(entry, str):
+        return entry
+    return _LOG_FORMATS[entry[0]].format(*entry[1:])
+
+# Die faces for rolling a whole monster turn's attacks at once
+_D20_FACES = tuple(range(1, 21))
 
 class CombatManager:
     """Manages combat encounters and rounds."""
+    __slots__ = ('current_round', 'initiative_order', 'player_acted', 'monsters_acted',
+                 'declared_spells', 'combat_log', 'log_count', '_recent_log_key', '_recent_log',
+                 '_in_melee', '_melee_cache_valid', '_to_hit', '_pending_xp')
     
     def __init__(self):
         self.current_round = 0
@@ -13,7 +62,14 @@ class CombatManager:
         self.player_acted = False
         self.monsters_acted = False
         self.declared_spells = []
-        self.combat_log = []
+        self.combat_log = deque(maxlen=COMBAT_LOG_LENGTH)
+        self.log_count = 0  # Entries ever logged; never reset, so it keys the recent-log cache
+        self._recent_log_key = None
+        self._recent_log = []
+        self._in_melee = False
+        self._melee_cache_valid = False
+        self._to_hit = {}  # (id(attacker), id(target)) -> required attack roll
+        self._pending_xp = 0  # XP from monsters slain or routed this combat
         
     def start_combat(self, player, monsters):
         """Initialize combat with the given participants."""
@@ -21,7 +77,9 @@ class CombatManager:
         self.player_acted = False
         self.monsters_acted = False
         self.declared_spells = []
-        self.combat_log = []
+        self.combat_log = deque(maxlen=COMBAT_LOG_LENGTH)
+        self._recent_log_key = None
+        self._pending_xp = 0
         
         # Reset monster combat state
         for monster in monsters:
@@ -29,65 +87,86 @@ class CombatManager:
         
         return self.start_new_round(player, monsters)
     
+    def _log(self, entry):
+        """Add an event tuple or fixed message to the combat log."""
+        self.combat_log.append(entry)
+        self.log_count += 1
+    
+    def get_recent_log(self, count=8):
+        """Get the last few log entries as text, formatting only when something new is logged."""
+        key = (self.log_count, count)
+        if key != self._recent_log_key:
+            # The log is a deque, so index the last few entries instead of slicing
+            combat_log = self.combat_log
+            self._recent_log = [format_combat_event(combat_log[i])
+                                for i in range(-min(count, len(combat_log)), 0)]
+            self._recent_log_key = key
+        return self._recent_log
+    
     def start_new_round(self, player, monsters):
         """Start a new combat round."""
         self.current_round += 1
         self.player_acted = False
         self.monsters_acted = False
+        self._melee_cache_valid = False
         
         # Reset monster acted state
         for monster in monsters:
             monster.has_acted_this_round = False
         
+        # Required rolls (THAC0 - target AC) for every attacker/target pair this round
+        player_id = id(player)
+        player_thac0 = player.character.thac0
+        player_ac = self.calculate_player_ac(player)
+        to_hit = self._to_hit = {}
+        for monster in monsters:
+            if monster.is_alive:
+                monster_id = id(monster)
+                to_hit[player_id, monster_id] = player_thac0 - monster.ac
+                to_hit[monster_id, player_id] = monster.thac0 - player_ac
+        
         # Roll initiative
-        player_initiative = random.randint(1, 6)
-        monster_initiative = random.randint(1, 6)
+        player_initiative = randrange(1, 7)
+        monster_initiative = randrange(1, 7)
         
-        self.combat_log.append(f"--- Round {self.current_round} ---")
-        self.combat_log.append(f"Initiative: Player {player_initiative}, Monsters {monster_initiative}")
+        self._log(('round', self.current_round))
+        self._log(('initiative', player_initiative, monster_initiative))
         
         if player_initiative > monster_initiative:
             self.initiative_order = ['player', 'monsters']
-            self.combat_log.append("Player acts first!")
+            self._log("Player acts first!")
         elif monster_initiative > player_initiative:
             self.initiative_order = ['monsters', 'player']
-            self.combat_log.append("Monsters act first!")
+            self._log("Monsters act first!")
         else:
             self.initiative_order = ['simultaneous']
-            self.combat_log.append("Simultaneous actions!")
+            self._log("Simultaneous actions!")
         
         return {
             'round': self.current_round,
             'initiative_order': self.initiative_order,
             'player_initiative': player_initiative,
             'monster_initiative': monster_initiative,
-            'phase': 'declare_spells'
+            'phase': CombatPhase.DECLARE_SPELLS
         }
     
     def get_available_actions(self, player, monsters, phase):
         """Get available actions for the current combat phase."""
-        if phase == 'declare_spells':
-            return ['Declare Spell', 'No Spell', 'Retreat']
-        elif phase == 'player_turn':
-            actions = []
-            
-            # Check if any monsters are in melee range (adjacent)
-            in_melee = any(self.calculate_distance(player, monster) <= 5 for monster in monsters if monster.is_alive)
-            
-            if in_melee:
-                actions.extend(['Melee Attack', 'Fighting Withdrawal'])
-            else:
-                actions.extend(['Move', 'Missile Attack'])
+        if phase == CombatPhase.DECLARE_SPELLS:
+            return _DECLARE_ACTIONS
+        elif phase == CombatPhase.PLAYER_TURN:
+            # Check if any monsters are in melee range (adjacent); this only changes
+            # when a monster drops out, so it is cached until then
+            if not self._melee_cache_valid:
+                self._in_melee = any(self.calculate_distance(player, monster) <= 5
+                                     for monster in monsters if monster.is_alive)
+                self._melee_cache_valid = True
             
-            if self.declared_spells:
-                actions.append('Cast Declared Spell')
-            
-            actions.extend(['Wait', 'Retreat'])
-            return actions
-        elif phase == 'monster_turn':
-            return ['Monsters Act']  # Automatic
+            return _PLAYER_ACTIONS[self._in_melee, bool(self.declared_spells)]
+        elif phase == CombatPhase.MONSTER_TURN:
+            return _MONSTER_ACTIONS
         
-        return []
+        return ()
     
     def calculate_distance(self, entity1, entity2):
         """Calculate distance between two entities (simplified)."""
@@ -95,59 +174,70 @@ class CombatManager:
         # In a full implementation, you'd track positions
         return 5  # Assume 5 feet (melee range)
     
-    def make_attack(self, attacker, target, attack_type='melee'):
-        """Execute an attack from attacker to target."""
-        # Get target AC
-        if hasattr(target, 'character'):
-            # Player target
-            target_ac = self.calculate_player_ac(target)
-            target_name = target.character.name
-        else:
-            # Monster target
-            target_ac = target.ac
-            target_name = target.name
+    def make_attack(self, attacker, target, attack_type='melee', roll=None):
+        """Execute an attack from attacker to target, optionally with a pre-rolled d20."""
+        # Resolve each side once; only the player carries a character sheet
+        attacker_character = getattr(attacker, 'character', None)
+        target_character = getattr(target, 'character', None)
+        
+        target_name = target_character.name if target_character is not None else target.name
         
         # Get attacker's relevant ability modifier
-        if hasattr(attacker, 'character'):
+        if attacker_character is not None:
             # Player attacker
             if attack_type == 'melee':
-                ability_mod = attacker.character.get_modifier(attacker.character.ability_scores['str'])
+                ability_mod = attacker_character.str_mod
             else:  # missile
-                ability_mod = attacker.character.get_modifier(attacker.character.ability_scores['dex'])
-            attacker_name = attacker.character.name
-            attacker_thac0 = attacker.character.thac0
+                ability_mod = attacker_character.dex_mod
+            attacker_name = attacker_character.name
+            attacker_thac0 = attacker_character.thac0
         else:
             # Monster attacker
             ability_mod = 0  # Monsters don't have ability scores in this simple system
             attacker_name = attacker.name
             attacker_thac0 = attacker.thac0
         
+        # Look up the required roll, working it out from the target's AC for unseen pairs
+        pair = (id(attacker), id(target))
+        required_roll = self._to_hit.get(pair)
+        if required_roll is None:
+            if target_character is not None:
+                # Player target
+                target_ac = self.calculate_player_ac(target)
+            else:
+                # Monster target
+                target_ac = target.ac
+            required_roll = self._to_hit[pair] = attacker_thac0 - target_ac
+        
         # Make attack roll
-        attack_result = self.make_attack_roll(attacker_thac0, target_ac, ability_mod)
+        attack_result = self.make_attack_roll(required_roll, ability_mod, roll=roll)
         
         if attack_result['hit']:
             # Roll damage
-            if hasattr(attacker, 'character'):
+            if attacker_character is not None:
                 # Player damage (simplified - using a basic weapon)
-                damage = random.randint(1, 6) + ability_mod if attack_type == 'melee' else random.randint(1, 6)
+                damage = randrange(1, 7) + ability_mod if attack_type == 'melee' else randrange(1, 7)
                 damage = max(1, damage)  # Minimum 1 damage
             else:
                 # Monster damage
                 damage = attacker.roll_damage()
             
             # Apply damage
-            if hasattr(target, 'character'):
+            if target_character is not None:
                 # Damage to player
-                target.character.hp -= damage
-                died = target.character.hp <= 0
+                target_character.hp -= damage
+                died = target_character.hp <= 0
             else:
                 # Damage to monster
                 died = target.take_damage(damage)
             
-            self.combat_log.append(f"{attacker_name} hits {target_name} for {damage} damage!")
+            self._log(('hit', attacker_name, target_name, damage))
             
             if died:
-                self.combat_log.append(f"{target_name} is slain!")
+                self._log(('slain', target_name))
+                self._melee_cache_valid = False
+                if target_character is None:
+                    self._pending_xp += target.xp_value
             
             return {
                 'hit': True,
@@ -157,7 +247,7 @@ class CombatManager:
                 'total': attack_result['total']
             }
         else:
-            self.combat_log.append(f"{attacker_name} attacks {target_name} but misses!")
+            self._log(('miss', attacker_name, target_name))
             return {
                 'hit': False,
                 'damage': 0,
@@ -166,13 +256,11 @@ class CombatManager:
                 'total': attack_result['total']
             }
     
-    def make_attack_roll(self, thac0, target_ac, ability_modifier=0, situational_modifier=0):
-        """Make an attack roll using THAC0 system."""
-        roll = random.randint(1, 20)
+    def make_attack_roll(self, required_roll, ability_modifier=0, situational_modifier=0, roll=None):
+        """Make an attack roll using THAC0 system against a required roll (THAC0 - target AC)."""
+        if roll is None:
+            roll = randrange(1, 21)
         total_roll = roll + ability_modifier + situational_modifier
-        
-        # Calculate required roll: THAC0 - Target AC
-        required_roll = thac0 - target_ac
         hit = total_roll >= required_roll
         
         return {
@@ -186,17 +274,25 @@ class CombatManager:
     
     def calculate_player_ac(self, player):
         """Calculate player's effective AC from equipment."""
+        # AC only changes with equipment or dexterity, so reuse it until invalidated
+        character = player.character
+        if character._ac_dirty:
+            character._cached_ac = self._recompute_ac(character)
+            character._ac_dirty = False
+        return character._cached_ac
+    
+    def _recompute_ac(self, character):
+        """Compute a character's AC from their equipment and dexterity."""
         base_ac = 10  # Unarmored AC 10
         ac_bonus = 0
         
         # Add armor bonuses (simplified)
-        for slot, item in player.character.equipped.items():
+        for slot, item in character.equipped.items():
             if item and item.item_type == 'armor':
                 ac_bonus += item.defense
         
         # Add dexterity modifier
-        dex_mod = player.character.get_modifier(player.character.ability_scores['dex'])
-        ac_bonus += dex_mod
+        ac_bonus += character.dex_mod
         
         return base_ac - ac_bonus  # Lower is better in AD&D
     
@@ -223,23 +319,30 @@ class CombatManager:
         """Execute all monster actions for their turn."""
         results = []
         
-        for monster in monsters:
-            if not monster.is_alive or monster.has_acted_this_round:
-                continue
-            
+        active_monsters = [monster for monster in monsters
+                           if monster.is_alive and not monster.has_acted_this_round]
+        if not active_monsters:
+            return results
+        
+        # Roll every monster's d20 for the turn in one call
+        attack_rolls = choices(_D20_FACES, k=len(active_monsters))
+        
+        for monster, attack_roll in zip(active_monsters, attack_rolls):
             # Check morale if monster is wounded
-            if monster.hp < monster.max_hp // 2:  # Below half health
+            if monster.hp < monster.half_hp:  # Below half health
                 if not monster.make_morale_check():
-                    self.combat_log.append(f"{monster.name} flees in terror!")
+                    self._log(('flee', monster.name))
                     monster.is_alive = False  # Remove from combat
                     monster.has_acted_this_round = True
+                    self._melee_cache_valid = False
+                    self._pending_xp += monster.xp_value  # Routed monsters still count as defeated
                     continue
             
             action = self.monster_ai_action(monster, player, monsters)
             
             if action:
-                if action['type'] in ['melee_attack', 'move_and_attack']:
-                    attack_result = self.make_attack(monster, player, 'melee')
+                if action['type'] in ('melee_attack', 'move_and_attack'):
+                    attack_result = self.make_attack(monster, player, 'melee', roll=attack_roll)
                     results.append({
                         'monster': monster,
                         'action': 'attack',
@@ -262,13 +365,21 @@ class CombatManager:
         else:
             return {'ended': False, 'result': None}
     
-    def award_experience(self, player, defeated_monsters):
-        """Award experience points for defeated monsters."""
-        total_xp = sum(monster.xp_value for monster in defeated_monsters if not monster.is_alive)
+    def award_experience(self, player, defeated_monsters=None):
+        """Award experience points for defeated monsters.
+        
+        XP for monsters slain or routed in this combat is tallied as they fall;
+        pass defeated_monsters to award XP for a specific list instead.
+        """
+        if defeated_monsters is None:
+            total_xp = self._pending_xp
+        else:
+            total_xp = sum(monster.xp_value for monster in defeated_monsters if not monster.is_alive)
+        self._pending_xp = 0
         
         if total_xp > 0:
             player.character.xp += total_xp
-            self.combat_log.append(f"You gain {total_xp} experience points!")
+            self._log(('xp', total_xp))
         
         return total_xp
     
@@ -276,7 +387,7 @@ class CombatManager:
         """Get a summary of the current combat state."""
         return {
             'round': self.current_round,
-            'log': self.combat_log.copy(),
+            'log': [format_combat_event(entry) for entry in self.combat_log],
             'initiative_order': self.initiative_order,
             'player_acted': self.player_acted,
             'monsters_acted': self.monsters_acted
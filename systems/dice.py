@@ -0,0 +1,44 @@
+# systems/dice.py
+"""
+Dice helpers shared by monsters, the monster factory and the other game systems.
+"""
+import functools
+import random
+
+# The one generator every game roll comes from; seed() makes a fight reproducible.
+# Its bound methods are exported so hot paths skip the attribute lookup.
+rng = random.Random()
+randrange = rng.randrange
+randint = rng.randint
+choices = rng.choices
+getrandbits = rng.getrandbits
+
+def seed(value=None):
+    """Reseed the shared dice generator."""
+    rng.seed(value)
+
+@functools.lru_cache(maxsize=128)
+def parse_dice(dice_string):
+    """Parse dice notation like '2d8', 'd6', '1d4+1' or '3' into (num_dice, die_size, bonus).
+    
+    Flat numbers parse as zero dice with the number as the bonus.
+    """
+    if '+' in dice_string:
+        dice_part, bonus = dice_string.split('+')
+        bonus = int(bonus)
+    elif '-' in dice_string:
+        dice_part, penalty = dice_string.split('-')
+        bonus = -int(penalty)
+    else:
+        dice_part = dice_string
+        bonus = 0
+    
+    if 'd' not in dice_part:
+        return 0, 0, int(dice_part) + bonus
+    
+    num_dice, die_size = dice_part.split('d')
+    num_dice = int(num_dice or 1)  # 'd6' means one die
+    die_size = int(die_size)
+    if die_size < 1:
+        raise ValueError(f"Invalid die size in {dice_string!r}")
+    return num_dice, die_size, bonus
\ No newline at end of file
@@ -2,37 +2,54 @@
 """
 Encounter system for the ASCII RPG game based on Old-School Essentials rules.
 """
-import random
 import sys
 import os
+from collections import Counter
 
 # Add the parent directory to Python path so we can import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from systems.monster_factory import MonsterFactory
+from systems.monster_factory import get_monster_factory
+from systems.dice import randrange, choices
+
+# Die faces for bulk rolls
+_D6_FACES = tuple(range(1, 7))
+
+# Spelled-out group sizes for encounter descriptions
+_NUMBER_WORDS = ('', 'one', 'two', 'three', 'four', 'five',
+                 'six', 'seven', 'eight', 'nine', 'ten')
+
+# Reaction -> flavor text shown during the interaction phase
+_REACTION_DESCRIPTIONS = {
+    'hostile': "The monsters bare their teeth and prepare to attack!",
+    'unfriendly': "The monsters eye you suspiciously and seem ready for trouble.",
+    'neutral': "The monsters notice you but seem uncertain what to do.",
+    'indifferent': "The monsters acknowledge your presence but continue their business.",
+    'friendly': "The monsters seem curious and approach cautiously."
+}
 
 class EncounterManager:
     """Manages wilderness encounters and reactions."""
     
     def __init__(self):
-        self.last_check_time = 0
         self.check_interval = 10000  # Check every 10 seconds of real time for demo
+        self.next_check_time = self.check_interval
         self.encounter_chance = 2  # 2-in-6 chance in wilderness
-        self.monster_factory = MonsterFactory()
+        self.monster_factory = get_monster_factory()
         
     def should_check_for_encounter(self, current_time, player_location):
         """Determine if we should check for a random encounter."""
         if player_location != 'overworld':
             return False
             
-        return current_time - self.last_check_time >= self.check_interval
+        return current_time >= self.next_check_time
     
     def check_for_encounter(self, terrain='forest'):
         """Check for a random encounter."""
         import pygame  # Import here to avoid circular imports
-        self.last_check_time = pygame.time.get_ticks()
+        self.next_check_time = pygame.time.get_ticks() + self.check_interval
         
-        roll = random.randint(1, 6)
+        roll = randrange(6) + 1
         if roll <= self.encounter_chance:
             monsters = self.monster_factory.generate_encounter_by_terrain(terrain)
             if monsters:
@@ -43,7 +60,7 @@ class EncounterManager:
     def create_encounter(self, monsters):
         """Create an encounter with the given monsters."""
         # Determine encounter distance (4d6 x 10 yards normally)
-        distance = sum(random.randint(1, 6) for _ in range(4)) * 10
+        distance = sum(choices(_D6_FACES, k=4)) * 10
         
         encounter = {
             'monsters': monsters,
@@ -65,8 +82,8 @@ class EncounterManager:
             return encounter
         
         # Roll surprise for both sides (1d6, surprised on 1-2)
-        player_roll = random.randint(1, 6)
-        monster_roll = random.randint(1, 6)
+        player_roll = randrange(6) + 1
+        monster_roll = randrange(6) + 1
         
         encounter['player_surprised'] = player_roll <= 2
         encounter['monsters_surprised'] = monster_roll <= 2
@@ -74,7 +91,7 @@ class EncounterManager:
         
         # Adjust distance if surprise occurs
         if encounter['player_surprised'] or encounter['monsters_surprised']:
-            encounter['distance'] = random.randint(1, 4) * 10
+            encounter['distance'] = (randrange(4) + 1) * 10
         
         # Determine next phase
         if encounter['player_surprised'] and not encounter['monsters_surprised']:
@@ -91,7 +108,7 @@ class EncounterManager:
         if encounter['reaction_rolled']:
             return encounter
         
-        roll = random.randint(1, 6) + random.randint(1, 6) + player_charisma_mod
+        roll = randrange(6) + randrange(6) + 2 + player_charisma_mod  # 2d6
         
         if roll <= 2:
             reaction = 'hostile'
@@ -120,18 +137,13 @@ class EncounterManager:
         
         return encounter
     
-    def get_reaction_description(self, reaction):
+    @staticmethod
+    def get_reaction_description(reaction):
         """Get a description of the monster reaction."""
-        descriptions = {
-            'hostile': "The monsters bare their teeth and prepare to attack!",
-            'unfriendly': "The monsters eye you suspiciously and seem ready for trouble.",
-            'neutral': "The monsters notice you but seem uncertain what to do.",
-            'indifferent': "The monsters acknowledge your presence but continue their business.",
-            'friendly': "The monsters seem curious and approach cautiously."
-        }
-        return descriptions.get(reaction, "The monsters react strangely.")
+        return _REACTION_DESCRIPTIONS.get(reaction, "The monsters react strangely.")
     
-    def can_attempt_evasion(self, encounter):
+    @staticmethod
+    def can_attempt_evasion(encounter):
         """Check if the party can attempt to evade before combat."""
         return (encounter['phase'] in ['reaction', 'interaction'] and 
                 encounter['reaction'] != 'hostile')
@@ -151,7 +163,7 @@ class EncounterManager:
         elif encounter['reaction'] == 'unfriendly':
             evasion_chance = 40
         
-        roll = random.randint(1, 100)
+        roll = randrange(100) + 1
         return roll <= evasion_chance
 
 class EncounterDisplay:
@@ -167,21 +179,14 @@ class EncounterDisplay:
             monster_desc = f"a {monsters[0].name}"
         else:
             # Group similar monsters
-            monster_types = {}
-            for monster in monsters:
-                if monster.name in monster_types:
-                    monster_types[monster.name] += 1
-                else:
-                    monster_types[monster.name] = 1
+            monster_types = Counter(monster.name for monster in monsters)
             
             if len(monster_types) == 1:
-                name, count = list(monster_types.items())[0]
+                (name, count), = monster_types.items()
                 if count == 2:
                     monster_desc = f"two {name}s"
                 elif count <= 10:
-                    numbers = ['', 'one', 'two', 'three', 'four', 'five', 
-                              'six', 'seven', 'eight', 'nine', 'ten']
-                    monster_desc = f"{numbers[count]} {name}s"
+                    monster_desc = f"{_NUMBER_WORDS[count]} {name}s"
                 else:
                     monster_desc = f"many {name}s"
             else:
@@ -195,7 +200,7 @@ class EncounterDisplay:
         elif encounter['phase'] == 'reaction':
             return base_desc + " They notice you as well."
         elif encounter['phase'] == 'interaction':
-            reaction_desc = EncounterManager().get_reaction_description(encounter['reaction'])
+            reaction_desc = EncounterManager.get_reaction_description(encounter['reaction'])
             return base_desc + " " + reaction_desc
         elif encounter['phase'] == 'combat':
             return base_desc + " Combat begins!"
@@ -224,7 +229,7 @@ class EncounterDisplay:
             ]
         elif encounter['phase'] == 'interaction':
             options = ["Try to communicate", "Prepare for combat"]
-            if EncounterManager().can_attempt_evasion(encounter):
+            if EncounterManager.can_attempt_evasion(encounter):
                 options.append("Attempt to flee")
             return options
         elif encounter['phase'] in ['player_surprise_round', 'monster_surprise_round']:
@@ -239,21 +244,38 @@ class EncounterDisplay:
 """
 Encounter system for the ASCII RPG game based on Old-School Essentials rules.
 """
-import random
 import sys
 import os
+from collections import Counter
 
 # Add the parent directory to Python path so we can import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from entities.monsters import generate_random_encounter
+from systems.dice import randrange, choices
+
+# Die faces for bulk rolls
+_D6_FACES = tuple(range(1, 7))
+
+# Spelled-out group sizes for encounter descriptions
+_NUMBER_WORDS = ('', 'one', 'two', 'three', 'four', 'five',
+                 'six', 'seven', 'eight', 'nine', 'ten')
+
+# Reaction -> flavor text shown during the interaction phase
+_REACTION_DESCRIPTIONS = {
+    'hostile': "The monsters bare their teeth and prepare to attack!",
+    'unfriendly': "The monsters eye you suspiciously and seem ready for trouble.",
+    'neutral': "The monsters notice you but seem uncertain what to do.",
+    'indifferent': "The monsters acknowledge your presence but continue their business.",
+    'friendly': "The monsters seem curious and approach cautiously."
+}
 
 class EncounterManager:
     """Manages wilderness encounters and reactions."""
     
     def __init__(self):
-        self.last_check_time = 0
         self.check_interval = 10000  # Check every 10 seconds of real time for demo
+        self.next_check_time = self.check_interval
         self.encounter_chance = 2  # 2-in-6 chance in wilderness
         
     def should_check_for_encounter(self, current_time, player_location):
@@ -261,13 +283,13 @@ class EncounterManager:
         if player_location != 'overworld':
             return False
             
-        return current_time - self.last_check_time >= self.check_interval
+        return current_time >= self.next_check_time
     
     def check_for_encounter(self, terrain='forest'):
         """Check for a random encounter."""
-        self.last_check_time = pygame.time.get_ticks()
+        self.next_check_time = pygame.time.get_ticks() + self.check_interval
         
-        roll = random.randint(1, 6)
+        roll = randrange(6) + 1
         if roll <= self.encounter_chance:
             monsters = generate_random_encounter(terrain)
             if monsters:
@@ -278,7 +300,7 @@ class EncounterManager:
     def create_encounter(self, monsters):
         """Create an encounter with the given monsters."""
         # Determine encounter distance (4d6 x 10 yards normally)
-        distance = sum(random.randint(1, 6) for _ in range(4)) * 10
+        distance = sum(choices(_D6_FACES, k=4)) * 10
         
         encounter = {
             'monsters': monsters,
@@ -300,8 +322,8 @@ class EncounterManager:
             return encounter
         
         # Roll surprise for both sides (1d6, surprised on 1-2)
-        player_roll = random.randint(1, 6)
-        monster_roll = random.randint(1, 6)
+        player_roll = randrange(6) + 1
+        monster_roll = randrange(6) + 1
         
         encounter['player_surprised'] = player_roll <= 2
         encounter['monsters_surprised'] = monster_roll <= 2
@@ -309,7 +331,7 @@ class EncounterManager:
         
         # Adjust distance if surprise occurs
         if encounter['player_surprised'] or encounter['monsters_surprised']:
-            encounter['distance'] = random.randint(1, 4) * 10
+            encounter['distance'] = (randrange(4) + 1) * 10
         
         # Determine next phase
         if encounter['player_surprised'] and not encounter['monsters_surprised']:
@@ -326,7 +348,7 @@ class EncounterManager:
         if encounter['reaction_rolled']:
             return encounter
         
-        roll = random.randint(1, 6) + random.randint(1, 6) + player_charisma_mod
+        roll = randrange(6) + randrange(6) + 2 + player_charisma_mod  # 2d6
         
         if roll <= 2:
             reaction = 'hostile'
@@ -355,18 +377,13 @@ class EncounterManager:
         
         return encounter
     
-    def get_reaction_description(self, reaction):
+    @staticmethod
+    def get_reaction_description(reaction):
         """Get a description of the monster reaction."""
-        descriptions = {
-            'hostile': "The monsters bare their teeth and prepare to attack!",
-            'unfriendly': "The monsters eye you suspiciously and seem ready for trouble.",
-            'neutral': "The monsters notice you but seem uncertain what to do.",
-            'indifferent': "The monsters acknowledge your presence but continue their business.",
-            'friendly': "The monsters seem curious and approach cautiously."
-        }
-        return descriptions.get(reaction, "The monsters react strangely.")
+        return _REACTION_DESCRIPTIONS.get(reaction, "The monsters react strangely.")
     
-    def can_attempt_evasion(self, encounter):
+    @staticmethod
+    def can_attempt_evasion(encounter):
         """Check if the party can attempt to evade before combat."""
         return (encounter['phase'] in ['reaction', 'interaction'] and 
                 encounter['reaction'] != 'hostile')
@@ -386,7 +403,7 @@ class EncounterManager:
         elif encounter['reaction'] == 'unfriendly':
             evasion_chance = 40
         
-        roll = random.randint(1, 100)
+        roll = randrange(100) + 1
         return roll <= evasion_chance
 
 import pygame  # Need this for time tracking
@@ -404,21 +421,14 @@ class EncounterDisplay:
             monster_desc = f"a {monsters[0].name}"
         else:
             # Group similar monsters
-            monster_types = {}
-            for monster in monsters:
-                if monster.name in monster_types:
-                    monster_types[monster.name] += 1
-                else:
-                    monster_types[monster.name] = 1
+            monster_types = Counter(monster.name for monster in monsters)
             
             if len(monster_types) == 1:
-                name, count = list(monster_types.items())[0]
+                (name, count), = monster_types.items()
                 if count == 2:
                     monster_desc = f"two {name}s"
                 elif count <= 10:
-                    numbers = ['', 'one', 'two', 'three', 'four', 'five', 
-                              'six', 'seven', 'eight', 'nine', 'ten']
-                    monster_desc = f"{numbers[count]} {name}s"
+                    monster_desc = f"{_NUMBER_WORDS[count]} {name}s"
                 else:
                     monster_desc = f"many {name}s"
             else:
@@ -432,7 +442,7 @@ class EncounterDisplay:
         elif encounter['phase'] == 'reaction':
             return base_desc + " They notice you as well."
         elif encounter['phase'] == 'interaction':
-            reaction_desc = EncounterManager().get_reaction_description(encounter['reaction'])
+            reaction_desc = EncounterManager.get_reaction_description(encounter['reaction'])
             return base_desc + " " + reaction_desc
         elif encounter['phase'] == 'combat':
             return base_desc + " Combat begins!"
@@ -461,7 +471,7 @@ class EncounterDisplay:
             ]
         elif encounter['phase'] == 'interaction':
             options = ["Try to communicate", "Prepare for combat"]
-            if EncounterManager().can_attempt_evasion(encounter):
+            if EncounterManager.can_attempt_evasion(encounter):
                 options.append("Attempt to flee")
             return options
         elif encounter['phase'] in ['player_surprise_round', 'monster_surprise_round']:
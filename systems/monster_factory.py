@@ -2,8 +2,8 @@
 """
 Data-driven monster factory for creating encounters from JSON data.
 """
+import functools
 import json
-import random
 import os
 import sys
 
@@ -11,6 +11,28 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from entities.monsters import Monster
+from systems.dice import parse_dice, randint, choices
+
+# Parsed dice used when a notation can't be read: a flat 1
+_FALLBACK_DICE = (0, 0, 1)
+
+def _parse_dice_or_fallback(dice_string):
+    """Parse dice notation, falling back to a flat 1 for anything unreadable."""
+    try:
+        return parse_dice(dice_string)
+    except Exception:
+        return _FALLBACK_DICE
+
+def _roll_dice(dice, count):
+    """Roll parsed (num_dice, die_size, bonus) dice count times; each total is at least 1."""
+    num_dice, die_size, bonus = dice
+    if not num_dice:
+        return [max(1, bonus)] * count
+    
+    # Roll every die for all the totals in one call, then sum each total's share
+    rolls = choices(range(1, die_size + 1), k=num_dice * count)
+    return [max(1, sum(rolls[i:i + num_dice]) + bonus)
+            for i in range(0, len(rolls), num_dice)]
 
 class MonsterFactory:
     """Factory for creating monsters from JSON data."""
@@ -19,6 +41,7 @@ class MonsterFactory:
         self.monster_data = {}
         self.encounter_tables = {}
         self.subtables = {}
+        self._parsed_dice = {}  # monster ID -> (parsed HP dice, parsed encounter size dice)
         self.load_monster_data()
     
     def load_monster_data(self):
@@ -37,6 +60,7 @@ class MonsterFactory:
             self.monster_data = data.get('monsters', {})
             self.encounter_tables = data.get('encounter_tables', {})
             self.subtables = data.get('subtables', {})
+            self.prepare_roll_dice()
             
         except Exception as e:
             print(f"Error loading monster data: {e}")
@@ -106,29 +130,39 @@ class MonsterFactory:
                 '7-8': {'category': 'animal', 'result': 'wolf'}
             }
         }
+        self.prepare_roll_dice()
+    
+    def prepare_roll_dice(self):
+        """Parse every monster's HP and encounter size dice once, when the data is loaded."""
+        self._parsed_dice = {
+            monster_id: (_parse_dice_or_fallback(data.get('hp_roll')),
+                         _parse_dice_or_fallback(data.get('encounter_size')))
+            for monster_id, data in self.monster_data.items()
+        }
     
     def create_monster(self, monster_id, custom_hp=None):
         """Create a monster instance from its ID."""
         if monster_id not in self.monster_data:
             # Fallback to kobold if monster not found
             monster_id = 'kobold'
-            
-        data = self.monster_data[monster_id]
         
         # Calculate HP
         if custom_hp:
             hp = custom_hp
         else:
-            hp = self.roll_hp(data['hp_roll'])
+            hp = _roll_dice(self._parsed_dice[monster_id][0], 1)[0]
         
-        # Create the monster
-        monster = Monster(
+        return Monster(hp=hp, **self._monster_kwargs(monster_id))
+    
+    def _monster_kwargs(self, monster_id):
+        """Build the Monster constructor arguments for a monster ID, minus HP."""
+        data = self.monster_data[monster_id]
+        return dict(
             name=data['name'],
             char=data['char'],
             color=tuple(data['color']),
             ac=data['ac'],
             hd=data['hd'],
-            hp=hp,
             attacks=data['attacks'],
             thac0=data['thac0'],
             movement=data['movement'],
@@ -138,61 +172,18 @@ class MonsterFactory:
             xp_value=data['xp_value'],
             special_abilities=data.get('special_abilities', [])
         )
-        
-        return monster
     
     def roll_hp(self, hp_roll_string):
         """Roll HP based on dice notation (e.g., '2d8', '1d4+1')."""
-        try:
-            # Handle simple cases like '2d8', '1d4+1', '1d4-1'
-            if '+' in hp_roll_string:
-                dice_part, bonus = hp_roll_string.split('+')
-                bonus = int(bonus)
-            elif '-' in hp_roll_string:
-                dice_part, penalty = hp_roll_string.split('-')
-                bonus = -int(penalty)
-            else:
-                dice_part = hp_roll_string
-                bonus = 0
-            
-            # Parse dice notation
-            if 'd' in dice_part:
-                num_dice, die_size = dice_part.split('d')
-                num_dice = int(num_dice)
-                die_size = int(die_size)
-                
-                total = sum(random.randint(1, die_size) for _ in range(num_dice))
-                return max(1, total + bonus)
-            else:
-                return max(1, int(dice_part) + bonus)
-                
-        except Exception:
-            return 1  # Fallback to 1 HP
+        return self.roll_hp_batch(hp_roll_string, 1)[0]
+    
+    def roll_hp_batch(self, hp_roll_string, count):
+        """Roll HP for several monsters at once from the same dice notation."""
+        return _roll_dice(_parse_dice_or_fallback(hp_roll_string), count)
     
     def roll_encounter_size(self, size_string):
         """Roll the number of monsters in an encounter."""
-        try:
-            if 'd' in size_string:
-                if '+' in size_string:
-                    dice_part, bonus = size_string.split('+')
-                    bonus = int(bonus)
-                elif '-' in size_string:
-                    dice_part, penalty = size_string.split('-')
-                    bonus = -int(penalty)
-                else:
-                    dice_part = size_string
-                    bonus = 0
-                
-                num_dice, die_size = dice_part.split('d')
-                num_dice = int(num_dice)
-                die_size = int(die_size)
-                
-                total = sum(random.randint(1, die_size) for _ in range(num_dice))
-                return max(1, total + bonus)
-            else:
-                return max(1, int(size_string))
-        except Exception:
-            return 1
+        return _roll_dice(_parse_dice_or_fallback(size_string), 1)[0]
     
     def generate_encounter_by_terrain(self, terrain):
         """Generate an encounter for a specific terrain."""
@@ -203,7 +194,7 @@ class MonsterFactory:
         table = self.encounter_tables[terrain]
         
         # Roll d8 for main encounter type
-        roll = random.randint(1, 8)
+        roll = randint(1, 8)
         
         # Find the appropriate entry
         for range_key, encounter_data in table.items():
@@ -245,14 +236,14 @@ class MonsterFactory:
         # Handle special subtables like dragon_flyer_insect
         if category and category in subtable:
             category_table = subtable[category]
-            roll = random.randint(1, 20)
+            roll = randint(1, 20)
             
             for range_key, monster_id in category_table.items():
                 if self.roll_in_range(roll, range_key):
                     return self.create_monster_group(monster_id)
         else:
             # Regular subtable
-            roll = random.randint(1, 20)
+            roll = randint(1, 20)
             
             for range_key, monster_id in subtable.items():
                 if self.roll_in_range(roll, range_key):
@@ -266,15 +257,16 @@ class MonsterFactory:
         if monster_id not in self.monster_data:
             monster_id = 'kobold'  # Fallback
         
-        data = self.monster_data[monster_id]
-        group_size = self.roll_encounter_size(data['encounter_size'])
+        # Dice were parsed at load time, so this is just the rolls
+        hp_dice, size_dice = self._parsed_dice[monster_id]
+        group_size = _roll_dice(size_dice, 1)[0]
         
-        monsters = []
-        for _ in range(group_size):
-            monster = self.create_monster(monster_id)
-            monsters.append(monster)
+        # Roll the whole group's HP together rather than once per monster
+        hit_points = _roll_dice(hp_dice, group_size)
         
-        return monsters
+        # Every group member shares the same stat arguments; only HP differs
+        base = self._monster_kwargs(monster_id)
+        return [Monster(hp=hp, **base) for hp in hit_points]
     
     def get_available_monsters(self):
         """Get a list of all available monster IDs."""
@@ -282,4 +274,9 @@ class MonsterFactory:
     
     def get_monster_info(self, monster_id):
         """Get the raw data for a monster."""
-        return self.monster_data.get(monster_id, None)
\ No newline at end of file
+        return self.monster_data.get(monster_id, None)
+
+@functools.lru_cache(maxsize=1)
+def get_monster_factory():
+    """Get the shared MonsterFactory, loading the monster data only once."""
+    return MonsterFactory()
\ No newline at end of file
@@ -48,7 +48,7 @@ class SaveSystem:
                     'pos': chest['pos'],
                     'item': SaveSystem._serialize_item(chest['item'])
                 }
-                for chest in world.treasure_chests
+                for chest in world.treasure_chests.values()
             ],
             
             # World state - save which tiles have been modified
@@ -99,10 +99,8 @@ class SaveSystem:
             ]
             
             # Load equipment
-            character.equipped = {
-                slot: SaveSystem._deserialize_item(item_data) if item_data else None
-                for slot, item_data in save_data['equipped'].items()
-            }
+            for slot, item_data in save_data['equipped'].items():
+                character.equipped[slot] = SaveSystem._deserialize_item(item_data) if item_data else None
             
             # Create player
             player = Player(save_data['player_x'], save_data['player_y'])
@@ -245,7 +243,7 @@ class SaveSystem:
                     'pos': chest['pos'],
                     'item': SaveSystem._serialize_item(chest['item'])
                 }
-                for chest in world.treasure_chests
+                for chest in world.treasure_chests.values()
             ],
             'world_modifications': getattr(world, 'modifications', {}),
             'entrances': world.entrances
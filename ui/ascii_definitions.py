@@ -404,4 +404,19 @@ class AsciiDefinitions:
         return legacy_mapping.get(old_char, 'grasslands')
 
 # Global instance
-ASCII_DEFS = AsciiDefinitions()
\ No newline at end of file
+ASCII_DEFS = AsciiDefinitions()
+
+# Rendered glyph surfaces keyed by (font, char, color)
+_GLYPH_CACHE = {}
+_GLYPH_CACHE_LIMIT = 4096
+
+def render_glyph(font, char, color):
+    """Render a single tile glyph, reusing a cached surface when possible."""
+    key = (font, char, color)
+    glyph = _GLYPH_CACHE.get(key)
+    if glyph is None:
+        # Pulsing colors produce many one-off entries, so keep the cache bounded
+        if len(_GLYPH_CACHE) >= _GLYPH_CACHE_LIMIT:
+            _GLYPH_CACHE.clear()
+        glyph = _GLYPH_CACHE[key] = font.render(char, True, color).convert_alpha()
+    return glyph
\ No newline at end of file
@@ -87,7 +87,7 @@ def draw_encounter_screen(screen, font, encounter, encounter_display):
     # Show reaction if rolled
     if encounter['reaction_rolled']:
         y += 30
-        reaction_desc = EncounterManager().get_reaction_description(encounter['reaction'])
+        reaction_desc = EncounterManager.get_reaction_description(encounter['reaction'])
         wrapped_reaction = textwrap.wrap(reaction_desc, width=50)
         
         for line in wrapped_reaction:
@@ -156,7 +156,7 @@ def draw_combat_screen(screen, font, player, monsters, combat_manager, selected_
     alive_monsters = [m for m in monsters if m.is_alive]
     for i, monster in enumerate(alive_monsters[:6]):  # Show up to 6 monsters
         status_text = f"{monster.name}: {monster.hp}/{monster.max_hp} HP"
-        color = C_TEXT if monster.hp > monster.max_hp // 2 else C_TEXT_DIM
+        color = C_TEXT if monster.hp > monster.half_hp else C_TEXT_DIM
         
         monster_surf = font.render(status_text, True, color)
         screen.blit(monster_surf, (70, y))
@@ -174,9 +174,7 @@ def draw_combat_screen(screen, font, player, monsters, combat_manager, selected_
     screen.blit(log_surf, (50, log_y))
     
     log_y += 30
-    recent_log = combat_manager.combat_log[-8:] if len(combat_manager.combat_log) > 8 else combat_manager.combat_log
-    
-    for entry in recent_log:
+    for entry in combat_manager.get_recent_log(8):
         if len(entry) > 70:  # Wrap long entries
             wrapped = textwrap.wrap(entry, width=70)
             for line in wrapped:
@@ -2,18 +2,27 @@
 """
 UI panel classes and drawing functions for the ASCII RPG game.
 """
+import enum
 import pygame
 import textwrap
 from config import SCREEN_WIDTH, ANIMATION_SPEED
+from entities.character import EQUIPMENT_SLOTS
 from ui.colors import *
 
+class PanelState(enum.IntEnum):
+    """Animation states of a sliding panel; only CLOSED is falsy."""
+    CLOSED = 0
+    OPENING = 1
+    OPEN = 2
+    CLOSING = 3
+
 class SlidingPanel:
     """Manages a panel that slides in and out from the side of the screen."""
     def __init__(self, width, height, side):
         self.rect = pygame.Rect(0, 0, width, height)
-        self.surface = pygame.Surface((width, height))
+        self.surface = pygame.Surface((width, height)).convert()  # Opaque, display format
         self.side = side
-        self.state = 'CLOSED'  # CLOSED, OPENING, OPEN, CLOSING
+        self.state = PanelState.CLOSED
         self.animation_progress = 0.0
 
         if side == 'left':
@@ -26,33 +35,33 @@ class SlidingPanel:
             self.closed_pos = SCREEN_WIDTH
 
     def toggle(self):
-        if self.state in ['CLOSED', 'CLOSING']:
-            self.state = 'OPENING'
-        elif self.state in ['OPEN', 'OPENING']:
-            self.state = 'CLOSING'
+        if self.state in (PanelState.CLOSED, PanelState.CLOSING):
+            self.state = PanelState.OPENING
+        elif self.state in (PanelState.OPEN, PanelState.OPENING):
+            self.state = PanelState.CLOSING
 
     def update(self):
-        if self.state == 'OPENING':
+        if self.state == PanelState.OPENING:
             if self.side == 'left':
                 self.rect.x = min(self.open_pos, self.rect.x + ANIMATION_SPEED)
                 if self.rect.x == self.open_pos:
-                    self.state = 'OPEN'
+                    self.state = PanelState.OPEN
             else:  # right
                 self.rect.x = max(self.open_pos, self.rect.x - ANIMATION_SPEED)
                 if self.rect.x == self.open_pos:
-                    self.state = 'OPEN'
-        elif self.state == 'CLOSING':
+                    self.state = PanelState.OPEN
+        elif self.state == PanelState.CLOSING:
             if self.side == 'left':
                 self.rect.x = max(self.closed_pos, self.rect.x - ANIMATION_SPEED)
                 if self.rect.x == self.closed_pos:
-                    self.state = 'CLOSED'
+                    self.state = PanelState.CLOSED
             else:  # right
                 self.rect.x = min(self.closed_pos, self.rect.x + ANIMATION_SPEED)
                 if self.rect.x == self.closed_pos:
-                    self.state = 'CLOSED'
+                    self.state = PanelState.CLOSED
 
     def draw(self, screen):
-        if self.state != 'CLOSED':
+        if self.state:
             screen.blit(self.surface, self.rect)
 
 def draw_panel_title(surface, text, rect, font):
@@ -129,13 +138,13 @@ def draw_inventory_panel(surface, player, font, focus, cursor_pos):
     equip_rect = pygame.Rect(10, 10, surface.get_width() - 20, 320)
     draw_panel_title(surface, "Equipment", equip_rect, font)
     y = 40
-    equipment_slots = list(player.character.equipped.keys())
+    equipped = player.character.equipped
     
     col1_x = 10
     col2_x = 150  # Start of item name column
     
-    for i, slot in enumerate(equipment_slots):
-        item = player.character.equipped[slot]
+    for i, slot in enumerate(EQUIPMENT_SLOTS):
+        item = equipped[slot]
         item_name = item.name if item else "---"
         
         prefix = "> " if focus == 'equipment' and i == cursor_pos else "  "
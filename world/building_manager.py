@@ -3,7 +3,7 @@
 Building system manager - handles transitions, visibility, and rendering.
 """
 import pygame
-from ui.ascii_definitions import ASCII_DEFS
+from ui.ascii_definitions import ASCII_DEFS, render_glyph
 
 class BuildingManager:
     """Manages building interactions, transitions, and rendering."""
@@ -194,7 +194,7 @@ class BuildingManager:
                     
                     screen_x = (x - camera.x) * TILE_SIZE
                     screen_y = (y - camera.y) * TILE_SIZE
-                    tile_surface = font.render(char, True, color)
+                    tile_surface = render_glyph(font, char, color)
                     surface.blit(tile_surface, (screen_x, screen_y))
                 
                 elif tile_id.endswith('_door'):
@@ -206,7 +206,7 @@ class BuildingManager:
                     
                     screen_x = (x - camera.x) * TILE_SIZE
                     screen_y = (y - camera.y) * TILE_SIZE
-                    tile_surface = font.render(char, True, color)
+                    tile_surface = render_glyph(font, char, color)
                     surface.blit(tile_surface, (screen_x, screen_y))
     
     def draw_building_interior(self, surface, font, camera, player):
@@ -234,11 +234,8 @@ class BuildingManager:
                     screen_x = (x - camera.x) * TILE_SIZE
                     screen_y = (y - camera.y) * TILE_SIZE
                     
-                    tile_surface = font.render(
-                        render_info['char'], 
-                        True, 
-                        render_info['color']
-                    )
+                    tile_surface = render_glyph(
+                        font, render_info['char'], render_info['color'])
                     surface.blit(tile_surface, (screen_x, screen_y))
     
     def _get_roof_color(self, building_type):
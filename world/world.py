@@ -5,7 +5,7 @@ Fixed world class with proper building and dungeon generation.
 import random
 import pygame
 from config import TILE_SIZE
-from ui.ascii_definitions import ASCII_DEFS, AsciiTile
+from ui.ascii_definitions import ASCII_DEFS, AsciiTile, render_glyph
 
 # Import the new modular generators
 from world.overworld_generator import OverworldGenerator
@@ -42,7 +42,7 @@ class World:
         self._create_tile_instances()
         
         # World data
-        self.treasure_chests = []
+        self.treasure_chests = {}  # Chest dicts keyed by (x, y) position
         self.rooms = []
         self.room_data = []
     
@@ -88,7 +88,7 @@ class World:
             self.width, self.height, dungeon_locations)
         
         # Store dungeon data
-        self.treasure_chests = dungeon_data['treasure_chests']
+        self.treasure_chests = {chest['pos']: chest for chest in dungeon_data['treasure_chests']}
         self.rooms = dungeon_data['rooms']
         self.room_data = dungeon_data['room_data']
         print(f"Generated dungeon with {len(self.rooms)} rooms and {len(self.treasure_chests)} treasure chests")
@@ -255,23 +255,25 @@ class World:
         start_y = max(0, int(camera.y))
         end_y = min(self.height, int(camera.y + surface.get_height() // TILE_SIZE) + 1)
         
-        # Draw terrain tiles
+        # Column screen positions are the same for every row, so compute them once
+        columns = list(zip(range(start_x, end_x),
+                           [(x - camera.x) * TILE_SIZE for x in range(start_x, end_x)]))
+        
+        # Draw terrain tiles, collected into a single batched blit
+        blit_seq = []
         for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
+            screen_y = (y - camera.y) * TILE_SIZE
+            tile_row = self.overworld_tile_ids[y]
+            for x, screen_x in columns:
                 # Skip building tiles - let building manager handle them
-                tile_id = self.overworld_tile_ids[y][x]
+                tile_id = tile_row[x]
                 if not (tile_id.endswith('_roof') or tile_id.endswith('_door')):
                     render_info = self.get_tile_render_info(x, y, player)
                     
-                    screen_x = (x - camera.x) * TILE_SIZE
-                    screen_y = (y - camera.y) * TILE_SIZE
-                    
-                    tile_surface = font.render(
-                        render_info['char'], 
-                        True, 
-                        render_info['color']
-                    )
-                    surface.blit(tile_surface, (screen_x, screen_y))
+                    tile_surface = render_glyph(
+                        font, render_info['char'], render_info['color'])
+                    blit_seq.append((tile_surface, (screen_x, screen_y)))
+        surface.blits(blit_seq, doreturn=False)
         
         # Draw building exteriors
         self.building_manager.draw_building_exterior(
@@ -290,20 +292,21 @@ class World:
         start_y = max(0, int(camera.y))
         end_y = min(self.height, int(camera.y + surface.get_height() // TILE_SIZE) + 1)
         
-        # Draw dungeon tiles
+        # Column screen positions are the same for every row, so compute them once
+        columns = list(zip(range(start_x, end_x),
+                           [(x - camera.x) * TILE_SIZE for x in range(start_x, end_x)]))
+        
+        # Draw dungeon tiles, collected into a single batched blit
+        blit_seq = []
         for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
+            screen_y = (y - camera.y) * TILE_SIZE
+            for x, screen_x in columns:
                 render_info = self.get_tile_render_info(x, y, player)
                 
-                screen_x = (x - camera.x) * TILE_SIZE
-                screen_y = (y - camera.y) * TILE_SIZE
-                
-                tile_surface = font.render(
-                    render_info['char'], 
-                    True, 
-                    render_info['color']
-                )
-                surface.blit(tile_surface, (screen_x, screen_y))
+                tile_surface = render_glyph(
+                    font, render_info['char'], render_info['color'])
+                blit_seq.append((tile_surface, (screen_x, screen_y)))
+        surface.blits(blit_seq, doreturn=False)
     
     def get_description(self, x, y, player):
         """Get a description of the tile at the given coordinates."""